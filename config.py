@@ -12,9 +12,19 @@ LOGS_DIR = BASE_DIR / "logs"
 # Configurações de scraping
 SCRAPING_CONFIG = {
     'timeout': 10,  # Timeout em segundos para requisições HTTP
-    'max_retries': 3,  # Número máximo de tentativas
+    'max_retries': 2,  # Número máximo de novas tentativas
+    'retry_backoff': 0.3,  # Fator de espera exponencial entre tentativas
+    'retry_status': (429, 500, 502, 503, 504),  # Status HTTP que disparam nova tentativa
     'delay_between_requests': 1,  # Delay entre requisições em segundos
-    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'headers': {  # Cabeçalhos enviados em todas as requisições
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept': 'text/html,application/xhtml+xml',
+        'Accept-Encoding': 'gzip, deflate'  # Respostas comprimidas; 'br' é acrescentado se o pacote brotli estiver instalado
+    },
+    'pool_connections': 4,  # Hosts com pool de conexões mantido em cache
+    'pool_maxsize': 20,  # Conexões keep-alive mantidas abertas por host
+    'cache_ttl': 60,  # Segundos em que uma página baixada é reaproveitada sem nova requisição
+    'cache_maxsize': 32,  # Número máximo de páginas mantidas no cache
     'max_news_items': 30  # Número máximo de notícias por scraping
 }
 
@@ -43,6 +53,7 @@ TEXT_PROCESSING = {
 
 # Configurações de armazenamento
 STORAGE_CONFIG = {
+    'primary': 'parquet',  # Formato canônico, sempre gravado; os demais são opcionais
     'sqlite': {
         'db_name': 'news_data.db',
         'enable': True
@@ -52,7 +63,9 @@ STORAGE_CONFIG = {
         'enable': True
     },
     'parquet': {
-        'compression': 'snappy',
+        'compression': 'zstd',
+        'compression_level': 3,
+        'use_dictionary': True,  # Codificação por dicionário para strings repetidas
         'enable': True
     },
     'json': {
@@ -72,17 +85,17 @@ LOGGING_CONFIG = {
     'backup_count': 5  # Número de arquivos de backup
 }
 
-# Stopwords adicionais personalizadas
+# Stopwords adicionais personalizadas (frozenset para busca O(1))
 CUSTOM_STOPWORDS = {
-    'english': [
+    'english': frozenset({
         'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have',
         'i', 'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you',
         'do', 'at', 'this', 'but', 'his', 'by', 'from', 'up', 'about'
-    ],
-    'portuguese': [
+    }),
+    'portuguese': frozenset({
         'de', 'a', 'o', 'que', 'e', 'é', 'do', 'da', 'em', 'um',
         'para', 'com', 'não', 'uma', 'os', 'no', 'se', 'na', 'por'
-    ]
+    })
 }
 
 # Configurações de análise
@@ -90,7 +103,8 @@ ANALYSIS_CONFIG = {
     'generate_word_cloud': True,  # Gerar dados para nuvem de palavras
     'calculate_statistics': True,  # Calcular estatísticas
     'min_word_frequency': 2,  # Frequência mínima para considerar palavra relevante
-    'vocabulary_analysis': True  # Análise de riqueza vocabular
+    'vocabulary_analysis': True,  # Análise de riqueza vocabular
+    'use_nltk_stopwords': False  # Acrescenta as stopwords do NLTK (exige download do corpus)
 }
 
 # Configurações de exportação
@@ -103,9 +117,6 @@ EXPORT_CONFIG = {
 
 # Validação de diretórios
 def ensure_directories():
-    """Cria diretórios necessários se não existirem"""
+    """Cria diretórios necessários se não existirem (chamado por main.py)"""
     DATA_DIR.mkdir(exist_ok=True)
-    LOGS_DIR.mkdir(exist_ok=True)
-
-# Executar validação ao importar
-ensure_directories()
\ No newline at end of file
+    LOGS_DIR.mkdir(exist_ok=True)
\ No newline at end of file
@@ -2,75 +2,95 @@ import argparse
 import sys
 from pathlib import Path
 from typing import List, Dict
-import json
 from datetime import datetime
 import time
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Adiciona o diretório src ao path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.scrapers.news_scraper import HackerNewsScraper, BBCNewsScraper, G1Scraper, FolhaScraper
+from config import ANALYSIS_CONFIG, EXPORT_CONFIG, STORAGE_CONFIG, ensure_directories
 from src.transformers.text_processor import TextProcessor
-from src.storage.data_storage import SQLiteStorage, CSVStorage, ParquetStorage, JSONStorage
 from src.utils.logger import setup_logger
 from src.utils.progress import (
     ProgressIndicator, TaskTracker, show_welcome_message, 
-    show_completion_message, print_colored
+    show_completion_message
 )
-from rich.console import Console
-from rich.panel import Panel
+from rich.console import Console, Group
 from rich.table import Table
-from rich.live import Live
-from rich.layout import Layout
-from rich import print as rprint
 
 # Configuração do logger e console
 logger = setup_logger()
 console = Console()
 
+# Campos de cada notícia gravados nos arquivos de saída
+EXPORT_FIELDS = ('title', 'processed_title', 'link', 'source', 'collected_at')
+
+# Fonte -> (classe do scraper em src.scrapers.news_scraper, idioma dos títulos)
+_SCRAPER_REGISTRY = {
+    'hackernews': ('HackerNewsScraper', 'english'),
+    'bbc': ('BBCNewsScraper', 'english'),
+    'g1': ('G1Scraper', 'portuguese'),
+    'folha': ('FolhaScraper', 'portuguese'),
+}
+
+# Barras de frequência pré-calculadas, indexadas pelo comprimento preenchido (0-20)
+_BARS = ["█" * n + "░" * (20 - n) for n in range(21)]
+
+
+@lru_cache(maxsize=8)
+def _get_text_processor(language: str, quiet: bool = False) -> TextProcessor:
+    """Retorna um TextProcessor por idioma (e modo silencioso), reaproveitado entre pipelines"""
+    return TextProcessor(language=language,
+                         use_nltk_stopwords=ANALYSIS_CONFIG['use_nltk_stopwords'],
+                         quiet=quiet)
+
 
 class NewsScraperPipeline:
     """Pipeline principal para scraping e processamento de notícias"""
     
-    def __init__(self, source: str = 'hackernews', storage_type: str = 'all'):
+    def __init__(self, source: str = 'hackernews', storage_type: str = STORAGE_CONFIG['primary'],
+                 quiet: bool = False):
         """
         Inicializa o pipeline
         
         Args:
             source: Fonte de notícias ('hackernews', 'bbc', 'g1', 'folha')
-            storage_type: Tipo de armazenamento ('sqlite', 'csv', 'parquet', 'json', 'all')
+            storage_type: Formato adicional ao Parquet ('sqlite', 'csv', 'parquet', 'json', 'all')
+            quiet: Suprime banners, tabelas e indicadores de progresso
         """
         self.source = source
         self.storage_type = storage_type
+        self.quiet = quiet
+        
+        # Console silencioso descarta a saída antes de qualquer renderização
+        self.console = Console(quiet=True) if quiet else console
+        
+        # Formatos opcionais resolvidos uma única vez (Parquet é sempre gravado)
+        storage = storage_type.lower()
+        self._use_sqlite = storage in ('sqlite', 'all')
+        self._use_csv = storage in ('csv', 'all')
+        self._use_json = storage in ('json', 'all')
         
-        # Inicializa scraper baseado na fonte
-        if source.lower() == 'hackernews':
-            self.scraper = HackerNewsScraper()
-            self.language = 'english'
-        elif source.lower() == 'bbc':
-            self.scraper = BBCNewsScraper()
-            self.language = 'english'
-        elif source.lower() == 'g1':
-            self.scraper = G1Scraper()
-            self.language = 'portuguese'
-        elif source.lower() == 'folha':
-            self.scraper = FolhaScraper()
-            self.language = 'portuguese'
-        else:
+        # Resolve scraper e idioma pela fonte
+        try:
+            scraper_name, self.language = _SCRAPER_REGISTRY[source.lower()]
+        except KeyError:
             raise ValueError(f"Fonte não suportada: {source}")
         
-        # Inicializa processador de texto com idioma apropriado
-        self.text_processor = TextProcessor(language=self.language)
+        # Módulo de scrapers importado só quando necessário
+        from src.scrapers import news_scraper
+        self.scraper = getattr(news_scraper, scraper_name)()
         
-        # Inicializa sistemas de armazenamento
-        self.sqlite_storage = SQLiteStorage()
-        self.csv_storage = CSVStorage()
-        self.parquet_storage = ParquetStorage()
-        self.json_storage = JSONStorage()
+        # Inicializa processador de texto com idioma apropriado
+        self.text_processor = _get_text_processor(self.language, quiet)
         
         # Inicializa rastreadores de progresso
         self.progress_indicator = ProgressIndicator()
+        self.progress_indicator.console = self.console
         self.task_tracker = TaskTracker()
+        self.task_tracker.console = self.console
         self.start_time = None
         
         logger.info(f"Pipeline inicializado para fonte: {source}")
@@ -80,7 +100,8 @@ class NewsScraperPipeline:
         self.start_time = time.time()
         
         # Mostra mensagem de boas-vindas
-        show_welcome_message()
+        if not self.quiet:
+            show_welcome_message()
         
         # Adiciona tarefas ao rastreador
         self.task_tracker.add_task('scraping', 'Extraindo notícias', 1)
@@ -120,16 +141,16 @@ class NewsScraperPipeline:
         self.task_tracker.complete_task('storage')
         
         # Mostra resumo das tarefas
-        console.print("\n")
+        self.console.print("\n")
         self.task_tracker.display_summary()
         
         # Relatório final
-        self._print_report(news_items, processed_data, word_frequency)
+        self._print_report(news_items, processed_data, word_frequency, files_saved)
     
     def _scrape_news(self) -> List[Dict]:
         """Executa o scraping de notícias"""
         try:
-            news_items = self.scraper.scrape()
+            news_items = self.scraper.scrape(show_progress=not self.quiet)
             self.progress_indicator.show_status(
                 f"Extraídas {len(news_items)} notícias de {self.source}",
                 "success"
@@ -144,17 +165,20 @@ class NewsScraperPipeline:
         # Extrai apenas os títulos
         titles = [item['title'] for item in news_items]
         
-        # Processa títulos
-        processed_titles = self.text_processor.process_titles(titles)
+        # Processa títulos mantendo o alinhamento com as notícias e anexa
+        # o resultado a cada item, evitando reparear por índice depois
+        processed = self.text_processor.process_titles(titles, keep_empty=True)
+        for item, processed_title in zip(news_items, processed):
+            item['processed_title'] = processed_title
+        processed_titles = [title for title in processed if title]
         
         # Calcula estatísticas
         stats = self.text_processor.get_statistics(processed_titles)
         
-        console.print(f"[cyan]✓ Processados {len(processed_titles)} títulos[/cyan]")
-        console.print(f"[cyan]✓ Palavras únicas encontradas: {stats['unique_words']}[/cyan]")
+        self.console.print(f"[cyan]✓ Processados {len(processed_titles)} títulos[/cyan]")
+        self.console.print(f"[cyan]✓ Palavras únicas encontradas: {stats['unique_words']}[/cyan]")
         
         return {
-            'original_titles': titles,
             'processed_titles': processed_titles,
             'statistics': stats
         }
@@ -174,86 +198,92 @@ class NewsScraperPipeline:
         for word, freq in word_freq[:5]:
             table.add_row(word, str(freq))
         
-        console.print(table)
+        self.console.print(table)
         
         return word_freq
     
     def _save_data(self, news_items: List[Dict], processed_data: Dict, word_frequency: List[tuple]) -> int:
         """Salva dados nos formatos especificados"""
+        # Timestamp único compartilhado por todos os arquivos desta execução
+        timestamp = time.strftime(EXPORT_CONFIG['timestamp_format'])
         
         # Prepara dados para salvamento
-        export_data = []
-        for i, item in enumerate(news_items):
-            processed_title = ""
-            if i < len(processed_data['processed_titles']):
-                processed_title = processed_data['processed_titles'][i]
-            
-            export_data.append({
-                'title': item['title'],
-                'processed_title': processed_title,
-                'link': item['link'],
-                'source': item['source'],
-                'collected_at': item['collected_at']
-            })
-        
-        # Salva em SQLite
-        if self.storage_type in ['sqlite', 'all']:
-            try:
-                self.sqlite_storage.save_raw_news(news_items)
-                self.sqlite_storage.save_word_frequency(word_frequency)
-            except Exception as e:
-                console.print(f"[red]✗ Erro ao salvar em SQLite: {e}[/red]")
+        export_data = [{field: item[field] for field in EXPORT_FIELDS} for item in news_items]
         
-        # Salva em CSV
-        if self.storage_type in ['csv', 'all']:
-            try:
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                self.csv_storage.save(export_data, f"news_{self.source}_{timestamp}.csv")
-                
-                # Salva frequência de palavras em CSV separado
-                freq_data = [{'word': w, 'frequency': f} for w, f in word_frequency]
-                self.csv_storage.save(freq_data, f"word_frequency_{timestamp}.csv")
-            except Exception as e:
-                console.print(f"[red]✗ Erro ao salvar em CSV: {e}[/red]")
-        
-        # Salva em Parquet
-        if self.storage_type in ['parquet', 'all']:
-            try:
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                self.parquet_storage.save(export_data, f"news_{self.source}_{timestamp}.parquet")
-            except Exception as e:
-                console.print(f"[red]✗ Erro ao salvar em Parquet: {e}[/red]")
+        metadata = {
+            'source': self.source,
+            'collected_at': datetime.now().isoformat(timespec='seconds'),
+            'total_news': len(news_items),
+            'statistics': processed_data['statistics']
+        }
+        freq_records = [{'word': w, 'frequency': f} for w, f in word_frequency]
+        
+        # Classes de armazenamento importadas sob demanda: só os formatos
+        # pedidos são carregados e inicializados
+        from src.storage.data_storage import ParquetStorage, JSONStorage
+        json_storage = JSONStorage(quiet=self.quiet)
         
-        # Salva em JSON
-        if self.storage_type in ['json', 'all']:
+        def save_sqlite():
+            from src.storage.data_storage import SQLiteStorage
+            sqlite_storage = SQLiteStorage(quiet=self.quiet)
             try:
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                
-                # Estrutura completa em JSON
-                full_data = {
-                    'metadata': {
-                        'source': self.source,
-                        'collected_at': datetime.now().isoformat(),
-                        'total_news': len(news_items),
-                        'statistics': processed_data['statistics']
-                    },
-                    'news': export_data,
-                    'word_frequency': [{'word': w, 'frequency': f} for w, f in word_frequency]
-                }
-                
-                self.json_storage.save(full_data, f"news_analysis_{timestamp}.json")
-            except Exception as e:
-                console.print(f"[red]✗ Erro ao salvar em JSON: {e}[/red]")
-        
-        # Retorna quantidade de arquivos salvos
+                sqlite_storage.save_raw_news(news_items)
+                sqlite_storage.save_word_frequency(word_frequency)
+            finally:
+                sqlite_storage.close()
+        
+        def save_csv():
+            from src.storage.data_storage import CSVStorage
+            csv_storage = CSVStorage(quiet=self.quiet)
+            csv_storage.save(export_data, f"news_{self.source}_{timestamp}.csv")
+            
+            # Salva frequência de palavras em CSV separado
+            csv_storage.save_rows(word_frequency, ['word', 'frequency'], f"word_frequency_{timestamp}.csv")
+        
+        def save_parquet():
+            ParquetStorage(quiet=self.quiet).save(export_data, f"news_{self.source}_{timestamp}.parquet")
+            
+            # Sidecar leve com metadados e frequência ao lado do Parquet
+            json_storage.save(
+                {'metadata': metadata, 'word_frequency': freq_records},
+                f"news_{self.source}_{timestamp}.meta.json"
+            )
+        
+        def save_json():
+            # Estrutura completa em JSON
+            full_data = {
+                'metadata': metadata,
+                'news': export_data,
+                'word_frequency': freq_records
+            }
+            
+            json_storage.save(full_data, f"news_analysis_{timestamp}.json")
+        
+        # Parquet é o armazenamento canônico; os demais formatos são opcionais
+        dispatch = [
+            (True, 'Parquet', save_parquet),
+            (self._use_sqlite, 'SQLite', save_sqlite),
+            (self._use_csv, 'CSV', save_csv),
+            (self._use_json, 'JSON', save_json),
+        ]
+        tasks = [(name, save) for enabled, name, save in dispatch if enabled]
+        
+        # Os formatos são independentes e limitados por I/O: grava em paralelo
         files_saved = 0
-        if self.storage_type == 'all':
-            files_saved = 4
-        else:
-            files_saved = 1
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {executor.submit(save): name for name, save in tasks}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    files_saved += 1
+                except Exception as e:
+                    console.print(f"[red]✗ Erro ao salvar em {futures[future]}: {e}[/red]")
+        
+        # Retorna quantidade de formatos salvos com sucesso
         return files_saved
     
-    def _print_report(self, news_items: List[Dict], processed_data: Dict, word_frequency: List[tuple]):
+    def _print_report(self, news_items: List[Dict], processed_data: Dict, word_frequency: List[tuple],
+                      files_saved: int):
         """Imprime relatório final da execução"""
         execution_time = time.time() - self.start_time
         
@@ -272,9 +302,6 @@ class NewsScraperPipeline:
         stats_table.add_row("Média Palavras/Título", f"{stats['avg_words_per_text']:.2f}")
         stats_table.add_row("Riqueza Vocabular", f"{stats['vocabulary_richness']:.3f}")
         
-        console.print("\n")
-        console.print(stats_table)
-        
         # Cria tabela com top 10 palavras
         word_table = Table(title="🔝 Top 10 Palavras Mais Frequentes")
         word_table.add_column("#", justify="right", style="dim")
@@ -284,47 +311,47 @@ class NewsScraperPipeline:
         
         max_freq = word_frequency[0][1] if word_frequency else 1
         for i, (word, freq) in enumerate(word_frequency[:10], 1):
-            bar_length = int((freq / max_freq) * 20)
-            bar = "█" * bar_length + "░" * (20 - bar_length)
-            word_table.add_row(str(i), word, str(freq), bar)
+            word_table.add_row(str(i), word, str(freq), _BARS[int((freq / max_freq) * 20)])
         
-        console.print("\n")
-        console.print(word_table)
+        # Renderiza as duas tabelas em uma única passada
+        self.console.print("\n")
+        self.console.print(Group(stats_table, "\n", word_table))
         
         # Mostra mensagem de conclusão
         completion_stats = {
             'news_count': len(news_items),
             'words_processed': stats['total_words'],
-            'files_saved': 4 if self.storage_type == 'all' else 1,
+            'files_saved': files_saved,
             'execution_time': f"{execution_time:.2f}s"
         }
         
-        console.print("\n")
-        show_completion_message(completion_stats)
+        self.console.print("\n")
+        if not self.quiet:
+            show_completion_message(completion_stats)
 
 
 def main():
     """Função principal"""
-    # Limpa a tela no início
-    console.clear()
     parser = argparse.ArgumentParser(
         description='Sistema de Scraping e Análise de Notícias',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog='''
 Exemplos de uso:
-  python main.py                          # Usa configurações padrão (Hacker News, todos os formatos)
+  python main.py                          # Usa configurações padrão (Hacker News, Parquet)
   python main.py --source bbc             # Scraping da BBC News
   python main.py --source g1              # Scraping do G1 (Brasil)
   python main.py --source folha           # Scraping da Folha de S.Paulo
-  python main.py --storage csv            # Salva apenas em CSV
+  python main.py --storage csv            # Salva em Parquet e também em CSV
+  python main.py --storage all            # Salva em todos os formatos
   python main.py --source g1 --storage sqlite  # G1 salvando em SQLite
+  python main.py --quiet                  # Sem banners e tabelas (ex.: cron)
         '''
     )
     
     parser.add_argument(
         '--source',
         type=str,
-        choices=['hackernews', 'bbc', 'g1', 'folha'],
+        choices=list(_SCRAPER_REGISTRY),
         default='hackernews',
         help='Fonte de notícias para scraping (padrão: hackernews)'
     )
@@ -333,17 +360,32 @@ Exemplos de uso:
         '--storage',
         type=str,
         choices=['sqlite', 'csv', 'parquet', 'json', 'all'],
-        default='all',
-        help='Formato de armazenamento dos dados (padrão: all)'
+        default=STORAGE_CONFIG['primary'],
+        help='Formato adicional ao Parquet, sempre gravado (padrão: parquet)'
+    )
+    
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Suprime banners, tabelas e progresso (automático fora de um terminal)'
     )
     
     args = parser.parse_args()
     
+    ensure_directories()
+    
+    # Saída decorativa só faz sentido em um terminal interativo
+    quiet = args.quiet or not sys.stdout.isatty()
+    if not quiet:
+        # Limpa a tela no início
+        console.clear()
+    
     try:
         # Cria e executa o pipeline
         pipeline = NewsScraperPipeline(
             source=args.source,
-            storage_type=args.storage
+            storage_type=args.storage,
+            quiet=quiet
         )
         pipeline.run()
         
@@ -1,19 +1,53 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
 from datetime import datetime
 import logging
-from typing import List, Dict, Optional
+from typing import AsyncIterator, ClassVar, List, Dict, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse
 from tqdm import tqdm
+import sys
+import threading
 import time
 
+from config import SCRAPING_CONFIG
+
+try:
+    # Cliente HTTP assíncrono, usado por scrape_async quando disponível
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    # Decodificador brotli: com ele, urllib3 e aiohttp descompactam respostas 'br'
+    import brotli
+except ImportError:
+    brotli = None
+
 logger = logging.getLogger(__name__)
 
+# Cabeçalhos das requisições; 'br' só é anunciado quando há como descompactar
+_HEADERS = dict(SCRAPING_CONFIG['headers'])
+if brotli is not None:
+    _HEADERS['Accept-Encoding'] += ', br'
+
 
 class NewsScraper:
     """Classe responsável por fazer scraping de sites de notícias"""
     
-    def __init__(self, base_url: str, timeout: int = 10):
+    # Cache de páginas compartilhado entre instâncias:
+    # url -> (instante da busca, corpo, cabeçalhos para GET condicional)
+    _page_cache: Dict[str, Tuple[float, bytes, Dict[str, str]]] = {}
+    
+    # Sessão HTTP única para todos os scrapers, criada no primeiro uso
+    _shared_session: ClassVar[Optional[requests.Session]] = None
+    _session_lock: ClassVar[threading.Lock] = threading.Lock()
+    
+    def __init__(self, base_url: str, timeout: int = SCRAPING_CONFIG['timeout']):
         """
         Inicializa o scraper com URL base e timeout configurável
         
@@ -23,53 +57,170 @@ class NewsScraper:
         """
         self.base_url = base_url
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self._host = urlparse(base_url).netloc
+        self.session = self._get_session()
+    
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """
+        Retorna a sessão HTTP compartilhada, criando-a no primeiro uso
+        
+        Compartilhar a sessão mantém as conexões keep-alive abertas entre
+        instâncias de scrapers, inclusive várias instâncias do mesmo site.
+        
+        Returns:
+            Sessão com cabeçalhos e pool de conexões configurados
+        """
+        with NewsScraper._session_lock:
+            if NewsScraper._shared_session is None:
+                session = requests.Session()
+                session.headers.update(_HEADERS)
+                
+                # Pool de conexões keep-alive reaproveitado entre requisições e tentativas
+                adapter = HTTPAdapter(
+                    pool_connections=SCRAPING_CONFIG['pool_connections'],
+                    pool_maxsize=SCRAPING_CONFIG['pool_maxsize'],
+                    max_retries=Retry(
+                        total=SCRAPING_CONFIG['max_retries'],
+                        backoff_factor=SCRAPING_CONFIG['retry_backoff'],
+                        status_forcelist=SCRAPING_CONFIG['retry_status']
+                    )
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                NewsScraper._shared_session = session
+            
+            return NewsScraper._shared_session
     
-    def fetch_page(self, url: Optional[str] = None, show_progress: bool = True) -> Optional[str]:
+    def fetch_page(self, url: Optional[str] = None, show_progress: bool = True,
+                   bypass_cache: bool = False) -> Optional[bytes]:
         """
         Busca o conteúdo HTML de uma página
         
+        Páginas buscadas há menos de SCRAPING_CONFIG['cache_ttl'] segundos
+        são devolvidas do cache; depois disso, a nova requisição é condicional
+        (ETag/Last-Modified) e uma resposta 304 reaproveita o corpo guardado.
+        
         Args:
             url: URL específica para buscar, usa base_url se None
             show_progress: Se deve mostrar progresso
+            bypass_cache: Ignora a cópia em cache ainda válida e consulta o servidor
             
         Returns:
-            Conteúdo HTML da página ou None em caso de erro
+            Bytes do HTML da página (a decodificação fica com o parser)
+            ou None em caso de erro
         """
         target_url = url or self.base_url
         
+        if not bypass_cache:
+            cached_body = self._get_cached(target_url)
+            if cached_body is not None:
+                return cached_body
+        
         try:
             if show_progress:
-                with tqdm(total=1, desc=f"Conectando a {self.base_url.split('//')[1].split('/')[0]}", 
-                         bar_format='{l_bar}{bar:20}| {n_fmt}/{total_fmt}', colour='cyan') as pbar:
-                    response = self.session.get(target_url, timeout=self.timeout, stream=True)
-                    response.raise_for_status()
+                with tqdm(total=1, desc=f"Conectando a {self._host}",
+                         bar_format='{l_bar}{bar:20}| {n_fmt}/{total_fmt}', colour='cyan',
+                         disable=not sys.stderr.isatty()) as pbar:
+                    body = self._request_page(target_url)
                     pbar.update(1)
-                    return response.text
+                    return body
             else:
-                response = self.session.get(target_url, timeout=self.timeout)
-                response.raise_for_status()
-                return response.text
+                return self._request_page(target_url)
         except requests.RequestException as e:
             logger.error(f"Erro ao buscar página {target_url}: {e}")
             return None
     
-    def parse_html(self, html_content: str) -> BeautifulSoup:
+    def _request_page(self, url: str) -> bytes:
+        """Executa o GET (condicional, se a página já está em cache) e atualiza o cache"""
+        response = self.session.get(url, timeout=self.timeout,
+                                    headers=self._conditional_headers(url))
+        if response.status_code == 304 and url in self._page_cache:
+            return self._revalidate(url)
+        
+        response.raise_for_status()
+        logger.debug(f"{url}: Content-Encoding={response.headers.get('Content-Encoding')}")
+        return self._store_page(url, response.content, response.headers)
+    
+    def _get_cached(self, url: str) -> Optional[bytes]:
+        """Retorna o corpo em cache da URL se ainda estiver dentro do TTL"""
+        entry = self._page_cache.get(url)
+        if entry and time.monotonic() - entry[0] < SCRAPING_CONFIG['cache_ttl']:
+            return entry[1]
+        return None
+    
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """Cabeçalhos If-None-Match/If-Modified-Since da cópia em cache, se houver"""
+        entry = self._page_cache.get(url)
+        return entry[2] if entry else {}
+    
+    def _store_page(self, url: str, body: bytes, headers) -> bytes:
         """
-        Converte HTML em objeto BeautifulSoup para parsing
+        Guarda o corpo da resposta no cache, descartando a entrada mais antiga
+        quando o limite de tamanho é atingido
         
         Args:
-            html_content: String contendo HTML
+            url: URL buscada
+            body: Corpo da resposta
+            headers: Cabeçalhos da resposta (de onde saem ETag e Last-Modified)
             
         Returns:
-            Objeto BeautifulSoup parseado
+            O próprio corpo, para encadear no retorno
         """
-        return BeautifulSoup(html_content, 'lxml')
+        validators = {
+            request_header: headers[response_header]
+            for response_header, request_header in (('ETag', 'If-None-Match'),
+                                                    ('Last-Modified', 'If-Modified-Since'))
+            if response_header in headers
+        }
+        
+        cache = self._page_cache
+        cache.pop(url, None)
+        if len(cache) >= SCRAPING_CONFIG['cache_maxsize']:
+            cache.pop(next(iter(cache)), None)
+        cache[url] = (time.monotonic(), body, validators)
+        return body
+    
+    def _revalidate(self, url: str) -> bytes:
+        """Renova o TTL da cópia em cache após um 304 Not Modified"""
+        _, body, validators = self._page_cache[url]
+        self._page_cache[url] = (time.monotonic(), body, validators)
+        return body
     
-    def extract_news(self, html_content: str) -> List[Dict[str, str]]:
+    def parse_html(self, html_content: Union[str, bytes]) -> LexborHTMLParser:
+        """
+        Converte HTML em árvore do parser Lexbor (selectolax) para parsing
+        
+        Args:
+            html_content: HTML em texto ou bytes; para bytes, a codificação é
+                detectada pelo parser (BOM ou <meta charset>)
+            
+        Returns:
+            Árvore HTML parseada, consultada com seletores CSS
+        """
+        return LexborHTMLParser(html_content, encoding=True)
+    
+    @staticmethod
+    def _absolutize(href: str, base: str) -> str:
+        """
+        Converte um link relativo em absoluto
+        
+        Args:
+            href: Valor do atributo href (pode ser vazio)
+            base: URL da página de onde o link foi extraído
+            
+        Returns:
+            Link absoluto, ou string vazia se href for vazio
+        """
+        if not href:
+            return ''
+        if href.startswith(('http://', 'https://')):
+            return href
+        if href.startswith('//'):
+            return 'https:' + href
+        return urljoin(base, href)
+    
+    def extract_news(self, html_content: Union[str, bytes]) -> List[Dict[str, str]]:
         """
         Extrai notícias do conteúdo HTML
         Deve ser sobrescrito por subclasses específicas
@@ -82,25 +233,188 @@ class NewsScraper:
         """
         raise NotImplementedError("Subclasses devem implementar extract_news")
     
-    def scrape(self) -> List[Dict[str, str]]:
+    async def fetch_page_async(self, url: Optional[str] = None,
+                               session: Optional['aiohttp.ClientSession'] = None,
+                               bypass_cache: bool = False) -> Optional[bytes]:
         """
-        Executa o processo completo de scraping
+        Busca o conteúdo HTML de uma página sem bloquear o event loop
         
+        Usa o mesmo cache de fetch_page.
+        
+        Args:
+            url: URL específica para buscar, usa base_url se None
+            session: Sessão aiohttp compartilhada; cria uma própria se None
+            bypass_cache: Ignora a cópia em cache ainda válida e consulta o servidor
+            
         Returns:
-            Lista de notícias extraídas
+            Bytes do HTML da página ou None em caso de erro
         """
-        html_content = self.fetch_page()
-        if not html_content:
-            return []
+        target_url = url or self.base_url
+        
+        if aiohttp is None:
+            # Sem aiohttp, executa a busca síncrona em uma thread separada
+            return await asyncio.to_thread(self.fetch_page, target_url, False, bypass_cache)
+        
+        if not bypass_cache:
+            cached_body = self._get_cached(target_url)
+            if cached_body is not None:
+                return cached_body
+        
+        try:
+            if session is None:
+                async with self.create_async_session() as own_session:
+                    return await self._get_body(own_session, target_url)
+            return await self._get_body(session, target_url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Erro ao buscar página {target_url}: {e}")
+            return None
+    
+    def create_async_session(self) -> 'aiohttp.ClientSession':
+        """
+        Cria uma sessão aiohttp com os mesmos cabeçalhos e timeout do scraper
         
-        news_items = self.extract_news(html_content)
+        Returns:
+            Sessão aiohttp com pool de 10 conexões (no máximo 4 por host)
+            e cache de DNS
+        """
+        return aiohttp.ClientSession(
+            headers=_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=aiohttp.TCPConnector(limit=10, limit_per_host=4, ttl_dns_cache=300)
+        )
+    
+    async def _get_body(self, session: 'aiohttp.ClientSession', url: str) -> bytes:
+        """Executa o GET assíncrono (condicional, se em cache) e retorna o corpo bruto"""
+        async with session.get(url, headers=self._conditional_headers(url)) as response:
+            if response.status == 304 and url in self._page_cache:
+                return self._revalidate(url)
+            
+            response.raise_for_status()
+            logger.debug(f"{url}: Content-Encoding={response.headers.get('Content-Encoding')}")
+            return self._store_page(url, await response.read(), response.headers)
+    
+    def _tag_items(self, news_items: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Adiciona timestamp de coleta às notícias extraídas
         
-        # Adiciona timestamp de coleta
+        Args:
+            news_items: Notícias retornadas por extract_news
+            
+        Returns:
+            A mesma lista, com collected_at preenchido
+        """
+        # Um único timestamp, compartilhado por todas as notícias do lote
         timestamp = datetime.now().isoformat()
         for item in news_items:
             item['collected_at'] = timestamp
         
         return news_items
+    
+    def scrape(self, show_progress: bool = True) -> List[Dict[str, str]]:
+        """
+        Executa o processo completo de scraping
+        
+        Args:
+            show_progress: Se deve mostrar o progresso da conexão
+            
+        Returns:
+            Lista de notícias extraídas
+        """
+        html_content = self.fetch_page(show_progress=show_progress)
+        if not html_content:
+            return []
+        
+        return self._tag_items(self.extract_news(html_content))
+    
+    async def scrape_async(self, session: Optional['aiohttp.ClientSession'] = None) -> List[Dict[str, str]]:
+        """
+        Versão assíncrona de scrape, para buscar várias páginas em paralelo
+        
+        Args:
+            session: Sessão aiohttp compartilhada; cria uma própria se None
+            
+        Returns:
+            Lista de notícias extraídas
+        """
+        html_content = await self.fetch_page_async(session=session)
+        if not html_content:
+            return []
+        
+        # O parsing é trabalho de CPU e continua síncrono
+        return self._tag_items(self.extract_news(html_content))
+
+
+def scrape_all(scrapers: List[NewsScraper]) -> List[List[Dict[str, str]]]:
+    """
+    Executa o scraping de vários sites em paralelo usando threads
+    
+    Alternativa síncrona a scrape_all_async: as esperas de rede se sobrepõem
+    e as conexões vêm do pool da sessão compartilhada.
+    
+    Args:
+        scrapers: Instâncias de scrapers a executar
+        
+    Returns:
+        Lista de notícias de cada scraper, na mesma ordem de scrapers
+    """
+    if not scrapers:
+        return []
+    
+    # Sem barra de conexão nas threads para não intercalar a saída
+    with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+        return list(executor.map(lambda scraper: scraper.scrape(show_progress=False), scrapers))
+
+
+async def scrape_all_async(scrapers: List[NewsScraper]) -> List[List[Dict[str, str]]]:
+    """
+    Executa o scraping de vários sites em paralelo com uma única sessão aiohttp
+    
+    O tempo total passa a ser o do site mais lento, e não a soma de todos.
+    
+    Args:
+        scrapers: Instâncias de scrapers a executar
+        
+    Returns:
+        Lista de notícias de cada scraper, na mesma ordem de scrapers
+    """
+    if not scrapers:
+        return []
+    
+    if aiohttp is None:
+        return list(await asyncio.gather(*(scraper.scrape_async() for scraper in scrapers)))
+    
+    async with scrapers[0].create_async_session() as session:
+        return list(await asyncio.gather(*(scraper.scrape_async(session) for scraper in scrapers)))
+
+
+async def scrape_all_streaming(scrapers: List[NewsScraper]) -> AsyncIterator[Dict[str, str]]:
+    """
+    Executa o scraping de vários sites em paralelo, entregando as notícias de
+    cada site assim que ele termina
+    
+    Diferente de scrape_all_async, quem consome não espera o site mais lento
+    para começar a processar (gravar, exibir) as primeiras notícias.
+    
+    Args:
+        scrapers: Instâncias de scrapers a executar
+        
+    Yields:
+        Notícias, agrupadas por site na ordem em que cada site conclui
+    """
+    if not scrapers:
+        return
+    
+    session_context = scrapers[0].create_async_session() if aiohttp is not None else nullcontext()
+    async with session_context as session:
+        tasks = [asyncio.ensure_future(scraper.scrape_async(session)) for scraper in scrapers]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for item in await next_done:
+                    yield item
+        finally:
+            # Se o consumidor parar antes do fim, não deixa buscas pendentes
+            for task in tasks:
+                task.cancel()
 
 
 class HackerNewsScraper(NewsScraper):
@@ -109,7 +423,7 @@ class HackerNewsScraper(NewsScraper):
     def __init__(self):
         super().__init__('https://news.ycombinator.com')
     
-    def extract_news(self, html_content: str) -> List[Dict[str, str]]:
+    def extract_news(self, html_content: Union[str, bytes]) -> List[Dict[str, str]]:
         """
         Extrai notícias do Hacker News
         
@@ -119,42 +433,33 @@ class HackerNewsScraper(NewsScraper):
         Returns:
             Lista de notícias com título e link
         """
-        soup = self.parse_html(html_content)
+        tree = self.parse_html(html_content)
         news_items = []
         
         # Busca elementos com classe 'athing' que contêm as notícias
-        stories = soup.find_all('tr', class_='athing')
+        stories = tree.css('tr.athing')
         
-        # Processa notícias com barra de progresso
+        # Processa as primeiras notícias
         stories_to_process = stories[:30]  # Limita a 30 notícias
         
-        with tqdm(total=len(stories_to_process), desc="Extraindo notícias", 
-                  bar_format='{l_bar}{bar:30}| {n_fmt}/{total_fmt} [{elapsed}]',
-                  colour='green') as pbar:
-            for story in stories_to_process:
-                try:
-                    title_cell = story.find('span', class_='titleline')
-                    if title_cell:
-                        link_elem = title_cell.find('a')
-                        if link_elem:
-                            title = link_elem.get_text(strip=True)
-                            href = link_elem.get('href', '')
-                            
-                            # Trata links relativos
-                            if href.startswith('item?'):
-                                href = urljoin(self.base_url, href)
-                            
-                            news_items.append({
-                                'title': title,
-                                'link': href,
-                                'source': 'Hacker News'
-                            })
-                except Exception as e:
-                    logger.warning(f"Erro ao processar notícia: {e}")
-                    continue
-                finally:
-                    pbar.update(1)
-                    time.sleep(0.01)  # Pequeno delay para visualização
+        for story in stories_to_process:
+            try:
+                link_elem = story.css_first('span.titleline a')
+                if link_elem:
+                    title = link_elem.text(strip=True)
+                    href = link_elem.attributes.get('href') or ''
+                    
+                    # Trata links relativos
+                    href = self._absolutize(href, self.base_url)
+                    
+                    news_items.append({
+                        'title': title,
+                        'link': href,
+                        'source': 'Hacker News'
+                    })
+            except Exception as e:
+                logger.warning(f"Erro ao processar notícia: {e}")
+                continue
         
         return news_items
 
@@ -162,10 +467,12 @@ class HackerNewsScraper(NewsScraper):
 class BBCNewsScraper(NewsScraper):
     """Scraper específico para BBC News"""
     
+    BBC_BASE = 'https://www.bbc.com'  # Endereço do site
+    
     def __init__(self):
-        super().__init__('https://www.bbc.com/news')
+        super().__init__(self.BBC_BASE + '/news')
     
-    def extract_news(self, html_content: str) -> List[Dict[str, str]]:
+    def extract_news(self, html_content: Union[str, bytes]) -> List[Dict[str, str]]:
         """
         Extrai notícias da BBC News
         
@@ -175,74 +482,36 @@ class BBCNewsScraper(NewsScraper):
         Returns:
             Lista de notícias com título e link
         """
-        soup = self.parse_html(html_content)
+        tree = self.parse_html(html_content)
         news_items = []
         
-        # Busca por diferentes padrões de manchetes na BBC
-        headlines = soup.find_all('h2', {'data-testid': True})
-        
-        # Processa manchetes com progresso
-        headlines_to_process = headlines[:30]
-        
-        if headlines_to_process:
-            with tqdm(total=len(headlines_to_process), desc="Extraindo manchetes BBC",
-                      bar_format='{l_bar}{bar:30}| {n_fmt}/{total_fmt} [{elapsed}]',
-                      colour='green') as pbar:
-                for headline in headlines_to_process:
-                    try:
-                        link = headline.find_parent('a')
-                        if link:
-                            title = headline.get_text(strip=True)
-                            href = link.get('href', '')
-                            
-                            # Converte links relativos em absolutos
-                            if href.startswith('/'):
-                                href = f"https://www.bbc.com{href}"
-                            
-                            if title and href:
-                                news_items.append({
-                                    'title': title,
-                                    'link': href,
-                                    'source': 'BBC News'
-                                })
-                    except Exception as e:
-                        logger.warning(f"Erro ao processar manchete BBC: {e}")
-                        continue
-                    finally:
-                        pbar.update(1)
-                        time.sleep(0.01)
-        
-        # Busca alternativa por artigos
-        if not news_items:
-            articles = soup.find_all('article')
-            articles_to_process = articles[:30]
-            with tqdm(total=len(articles_to_process), desc="Extraindo artigos BBC",
-                      bar_format='{l_bar}{bar:30}| {n_fmt}/{total_fmt} [{elapsed}]',
-                      colour='green') as pbar:
-                for article in articles_to_process:
-                    try:
-                        h3 = article.find('h3')
-                        if h3:
-                            link = h3.find_parent('a') or article.find('a')
-                            if link:
-                                title = h3.get_text(strip=True)
-                                href = link.get('href', '')
-                                
-                                if href.startswith('/'):
-                                    href = f"https://www.bbc.com{href}"
-                                
-                                if title and href:
-                                    news_items.append({
-                                        'title': title,
-                                        'link': href,
-                                        'source': 'BBC News'
-                                    })
-                    except Exception as e:
-                        logger.warning(f"Erro ao processar artigo BBC: {e}")
-                        continue
-                    finally:
-                        pbar.update(1)
-                        time.sleep(0.01)
+        # Busca por diferentes padrões de manchetes na BBC em uma única
+        # consulta: links que envolvem uma manchete h2 com data-testid ou,
+        # dentro de artigos, um título h3
+        links = tree.css('a:has(h2[data-testid]), article a:has(h3)')
+        
+        # Processa as primeiras manchetes
+        links_to_process = links[:30]
+        
+        for link in links_to_process:
+            try:
+                headline = link.css_first('h2[data-testid], h3')
+                if headline:
+                    title = headline.text(strip=True)
+                    href = link.attributes.get('href') or ''
+                    
+                    # Converte links relativos em absolutos
+                    href = self._absolutize(href, self.base_url)
+                    
+                    if title and href:
+                        news_items.append({
+                            'title': title,
+                            'link': href,
+                            'source': 'BBC News'
+                        })
+            except Exception as e:
+                logger.warning(f"Erro ao processar manchete BBC: {e}")
+                continue
         
         return news_items
 
@@ -250,10 +519,23 @@ class BBCNewsScraper(NewsScraper):
 class G1Scraper(NewsScraper):
     """Scraper específico para G1 (Portal Globo)"""
     
+    G1_BASE = 'https://g1.globo.com'  # Endereço do site
+    
+    # Busca por posts e manchetes principais
+    # G1 usa classes específicas para diferentes tipos de conteúdo
+    NEWS_SELECTOR = ', '.join([
+        'a.feed-post-link',  # Links de posts no feed
+        'div.bastian-page a',  # Links na página principal
+        'div.feed-post-body a',  # Posts no feed de notícias
+        'div._evt a',  # Elementos com eventos
+        'div.hui-premium a',  # Conteúdo premium
+        'h2 a',  # Títulos em h2 com links
+    ])
+    
     def __init__(self):
-        super().__init__('https://g1.globo.com')
+        super().__init__(self.G1_BASE)
     
-    def extract_news(self, html_content: str) -> List[Dict[str, str]]:
+    def extract_news(self, html_content: Union[str, bytes]) -> List[Dict[str, str]]:
         """
         Extrai notícias do G1
         
@@ -263,117 +545,70 @@ class G1Scraper(NewsScraper):
         Returns:
             Lista de notícias com título e link
         """
-        soup = self.parse_html(html_content)
+        tree = self.parse_html(html_content)
         news_items = []
         
-        # Busca por posts e manchetes principais
-        # G1 usa classes específicas para diferentes tipos de conteúdo
-        selectors = [
-            ('a.feed-post-link', None),  # Links de posts no feed
-            ('div.bastian-page a', None),  # Links na página principal
-            ('div.feed-post-body', 'a'),  # Posts no feed de notícias
-            ('div._evt', 'a'),  # Elementos com eventos
-            ('div.hui-premium', 'a'),  # Conteúdo premium
-            ('h2', 'a'),  # Títulos em h2 com links
-        ]
-        
-        all_articles = []
-        
-        # Coleta elementos usando diferentes seletores
-        for selector, child_selector in selectors:
-            elements = soup.select(selector)
-            for elem in elements:
-                if child_selector:
-                    link_elem = elem.find(child_selector)
-                else:
-                    link_elem = elem if elem.name == 'a' else elem.find('a')
+        # Uma única consulta com todos os seletores, deduplicada por href
+        # mantendo a ordem do documento
+        unique_articles = {}
+        for article in tree.css(self.NEWS_SELECTOR):
+            href = article.attributes.get('href')
+            if href:
+                unique_articles.setdefault(href, article)
+        
+        # Processa os primeiros artigos únicos
+        articles_to_process = list(unique_articles.items())[:30]
+        
+        for href, article in articles_to_process:
+            try:
+                # Extrai título - pode estar no texto do link ou em elemento filho
+                title = article.text(strip=True)
                 
-                if link_elem and link_elem not in all_articles:
-                    all_articles.append(link_elem)
-        
-        # Remove duplicatas mantendo ordem
-        seen_hrefs = set()
-        unique_articles = []
-        for article in all_articles:
-            href = article.get('href', '')
-            if href and href not in seen_hrefs:
-                seen_hrefs.add(href)
-                unique_articles.append(article)
-        
-        # Processa artigos únicos com progresso
-        articles_to_process = unique_articles[:30]
-        
-        if articles_to_process:
-            with tqdm(total=len(articles_to_process), desc="Extraindo notícias G1",
-                      bar_format='{l_bar}{bar:30}| {n_fmt}/{total_fmt} [{elapsed}]',
-                      colour='green') as pbar:
-                for article in articles_to_process:
-                    try:
-                        # Extrai título - pode estar no texto do link ou em elemento filho
-                        title = article.get_text(strip=True)
-                        
-                        # Se título muito curto, tenta pegar de elementos filhos
-                        if len(title) < 10:
-                            title_elem = article.find(['h2', 'h3', 'span', 'div'])
-                            if title_elem:
-                                title = title_elem.get_text(strip=True)
-                        
-                        # Pega o link
-                        href = article.get('href', '')
-                        
-                        # Garante que é um link válido do G1
-                        if href and not href.startswith('http'):
-                            if href.startswith('/'):
-                                href = f"https://g1.globo.com{href}"
-                            else:
-                                href = f"https:{href}" if href.startswith('//') else ''
-                        
-                        # Filtra apenas links válidos de notícias
-                        if (href and title and len(title) > 10 and 
-                            ('globo.com' in href or 'g1.com' in href)):
-                            news_items.append({
-                                'title': title,
-                                'link': href,
-                                'source': 'G1'
-                            })
-                    except Exception as e:
-                        logger.warning(f"Erro ao processar notícia G1: {e}")
-                        continue
-                    finally:
-                        pbar.update(1)
-                        time.sleep(0.01)
+                # Se título muito curto, tenta pegar de elementos filhos
+                if len(title) < 10:
+                    title_elem = article.css_first('h2, h3, span, div')
+                    if title_elem:
+                        title = title_elem.text(strip=True)
+                
+                # Garante que é um link absoluto
+                href = self._absolutize(href, self.base_url)
+                
+                # Filtra apenas links válidos de notícias
+                if (href and title and len(title) > 10 and 
+                    ('globo.com' in href or 'g1.com' in href)):
+                    news_items.append({
+                        'title': title,
+                        'link': href,
+                        'source': 'G1'
+                    })
+            except Exception as e:
+                logger.warning(f"Erro ao processar notícia G1: {e}")
+                continue
         
         # Se não encontrou notícias, tenta busca mais genérica
         if not news_items:
-            all_links = soup.find_all('a', href=True)[:50]
+            all_links = tree.css('a[href]')[:50]
             
-            with tqdm(total=len(all_links), desc="Busca alternativa G1",
-                      bar_format='{l_bar}{bar:30}| {n_fmt}/{total_fmt}',
-                      colour='yellow') as pbar:
-                for link in all_links:
-                    try:
-                        title = link.get_text(strip=True)
-                        href = link.get('href', '')
-                        
-                        if not href.startswith('http'):
-                            if href.startswith('/'):
-                                href = f"https://g1.globo.com{href}"
+            for link in all_links:
+                try:
+                    title = link.text(strip=True)
+                    href = link.attributes.get('href') or ''
+                    
+                    href = self._absolutize(href, self.base_url)
+                    
+                    # Filtra links válidos de notícias
+                    if (title and len(title) > 20 and href and 
+                        'globo.com' in href and 'noticia' in href.lower()):
+                        news_items.append({
+                            'title': title,
+                            'link': href,
+                            'source': 'G1'
+                        })
                         
-                        # Filtra links válidos de notícias
-                        if (title and len(title) > 20 and href and 
-                            'globo.com' in href and 'noticia' in href.lower()):
-                            news_items.append({
-                                'title': title,
-                                'link': href,
-                                'source': 'G1'
-                            })
-                            
-                            if len(news_items) >= 30:
-                                break
-                    except:
-                        pass
-                    finally:
-                        pbar.update(1)
+                        if len(news_items) >= 30:
+                            break
+                except:
+                    pass
         
         return news_items
 
@@ -381,10 +616,20 @@ class G1Scraper(NewsScraper):
 class FolhaScraper(NewsScraper):
     """Scraper específico para Folha de S.Paulo"""
     
+    # Seletores específicos da Folha
+    NEWS_SELECTOR = ', '.join([
+        'h2.c-headline__title a',  # Manchetes principais
+        'h3.c-headline__title a',  # Manchetes secundárias
+        'div.c-headline a',  # Links de manchetes
+        'article a.c-headline__url',  # Artigos
+        'div.u-list-unstyled a',  # Listas de notícias
+        'a[href*="/2024/"], a[href*="/2025/"]'  # Links com padrão de data
+    ])
+    
     def __init__(self):
         super().__init__('https://www.folha.uol.com.br')
     
-    def extract_news(self, html_content: str) -> List[Dict[str, str]]:
+    def extract_news(self, html_content: Union[str, bytes]) -> List[Dict[str, str]]:
         """
         Extrai notícias da Folha de S.Paulo
         
@@ -394,58 +639,33 @@ class FolhaScraper(NewsScraper):
         Returns:
             Lista de notícias com título e link
         """
-        soup = self.parse_html(html_content)
+        tree = self.parse_html(html_content)
         news_items = []
         
-        # Seletores específicos da Folha
-        selectors = [
-            'h2.c-headline__title a',  # Manchetes principais
-            'h3.c-headline__title a',  # Manchetes secundárias
-            'div.c-headline a',  # Links de manchetes
-            'article a.c-headline__url',  # Artigos
-            'div.u-list-unstyled a',  # Listas de notícias
-            'a[href*="/2024/"], a[href*="/2025/"]'  # Links com padrão de data
-        ]
-        
-        all_articles = []
-        for selector in selectors:
-            all_articles.extend(soup.select(selector))
-        
-        # Remove duplicatas
-        seen = set()
-        unique_articles = []
-        for article in all_articles:
-            href = article.get('href', '')
-            if href and href not in seen:
-                seen.add(href)
-                unique_articles.append(article)
-        
-        articles_to_process = unique_articles[:30]
-        
-        if articles_to_process:
-            with tqdm(total=len(articles_to_process), desc="Extraindo notícias Folha",
-                      bar_format='{l_bar}{bar:30}| {n_fmt}/{total_fmt} [{elapsed}]',
-                      colour='green') as pbar:
-                for article in articles_to_process:
-                    try:
-                        title = article.get_text(strip=True)
-                        href = article.get('href', '')
-                        
-                        # Ajusta URLs relativas
-                        if href and not href.startswith('http'):
-                            href = urljoin(self.base_url, href)
-                        
-                        if title and len(title) > 10 and href:
-                            news_items.append({
-                                'title': title,
-                                'link': href,
-                                'source': 'Folha de S.Paulo'
-                            })
-                    except Exception as e:
-                        logger.warning(f"Erro ao processar notícia Folha: {e}")
-                        continue
-                    finally:
-                        pbar.update(1)
-                        time.sleep(0.01)
+        # Uma única consulta com todos os seletores, deduplicada por href
+        unique_articles = {}
+        for article in tree.css(self.NEWS_SELECTOR):
+            href = article.attributes.get('href')
+            if href:
+                unique_articles.setdefault(href, article)
+        
+        articles_to_process = list(unique_articles.items())[:30]
+        
+        for href, article in articles_to_process:
+            try:
+                title = article.text(strip=True)
+                
+                # Ajusta URLs relativas
+                href = self._absolutize(href, self.base_url)
+                
+                if title and len(title) > 10 and href:
+                    news_items.append({
+                        'title': title,
+                        'link': href,
+                        'source': 'Folha de S.Paulo'
+                    })
+            except Exception as e:
+                logger.warning(f"Erro ao processar notícia Folha: {e}")
+                continue
         
         return news_items
\ No newline at end of file
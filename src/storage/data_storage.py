@@ -1,31 +1,131 @@
 import sqlite3
+import threading
 import csv
+import gzip
 import json
-import pandas as pd
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Set, Tuple
 from datetime import datetime
 import logging
 from tqdm import tqdm
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+
+from config import STORAGE_CONFIG
+
+try:
+    # Serializador JSON em Rust, bem mais rápido que o json da stdlib
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 console = Console()
 
 
+def _is_json_lines(filepath: Path) -> bool:
+    """Indica se o arquivo usa o formato JSON Lines (um registro por linha)"""
+    return filepath.suffix in ('.jsonl', '.ndjson')
+
+
+def _union_fieldnames(data: List[Dict]) -> List[str]:
+    """
+    Retorna a união das chaves dos registros, na ordem em que aparecem
+    
+    Args:
+        data: Registros a inspecionar
+        
+    Returns:
+        Lista de nomes de colunas
+    """
+    return list(dict.fromkeys(key for row in data for key in row))
+
+
+def _column_converter(values: List[str]):
+    """
+    Escolhe o tipo de uma coluna CSV a partir de todos os seus valores,
+    como o pandas fazia na leitura (int, float, bool ou texto)
+    
+    Args:
+        values: Valores não vazios da coluna, como texto
+        
+    Returns:
+        Função que converte um valor da coluna, ou None para manter texto
+    """
+    if not values:
+        return None
+    
+    for converter in (int, float):
+        try:
+            for value in values:
+                converter(value)
+        except ValueError:
+            continue
+        return converter
+    
+    if all(value in ('True', 'False') for value in values):
+        return lambda value: value == 'True'
+    
+    return None
+
+
+def _convert_csv_rows(rows: List[Dict]) -> List[Dict]:
+    """
+    Converte, coluna a coluna, os valores lidos de um CSV para tipos Python;
+    células vazias viram None
+    
+    Args:
+        rows: Registros lidos pelo csv.DictReader (valores como texto)
+        
+    Returns:
+        Os mesmos registros, com os valores convertidos
+    """
+    converters = {}
+    for column in _union_fieldnames(rows):
+        values = [row[column] for row in rows if row.get(column)]
+        converters[column] = _column_converter(values)
+    
+    for row in rows:
+        for column, value in row.items():
+            if value == '' or value is None:
+                row[column] = None
+            elif converters.get(column) is not None:
+                row[column] = converters[column](value)
+    
+    return rows
+
+
+def _write_dict_rows(f, data: List[Dict]):
+    """
+    Escreve uma lista de dicionários como CSV em um arquivo já aberto
+    
+    Args:
+        f: Arquivo de texto aberto para escrita
+        data: Registros a escrever; as colunas são a união das chaves,
+            na ordem em que aparecem
+    """
+    fieldnames = _union_fieldnames(data)
+    writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
+    writer.writeheader()
+    writer.writerows(data)
+
+
 class DataStorage:
     """Classe base para armazenamento de dados"""
     
-    def __init__(self, base_path: str = "data"):
+    def __init__(self, base_path: str = "data", quiet: bool = False):
         """
         Inicializa o sistema de armazenamento
         
         Args:
             base_path: Diretório base para armazenar dados
+            quiet: Suprime mensagens e barras de progresso
         """
         self.base_path = Path(base_path)
         self.base_path.mkdir(exist_ok=True)
+        self.quiet = quiet
+        
+        # Console silencioso descarta a saída antes de qualquer renderização
+        self.console = Console(quiet=True) if quiet else console
     
     def save(self, data: List[Dict], filename: str):
         """Método abstrato para salvar dados"""
@@ -34,26 +134,77 @@ class DataStorage:
     def load(self, filename: str):
         """Método abstrato para carregar dados"""
         raise NotImplementedError("Subclasses devem implementar o método load")
+    
+    def iter_load(self, filename: str) -> Iterator[Dict]:
+        """Método abstrato para carregar dados registro a registro"""
+        raise NotImplementedError("Subclasses devem implementar o método iter_load")
 
 
 class SQLiteStorage(DataStorage):
     """Armazenamento usando SQLite"""
     
-    def __init__(self, base_path: str = "data", db_name: str = "news_data.db"):
+    def __init__(self, base_path: str = "data", db_name: str = "news_data.db",
+                 quiet: bool = False):
         """
         Inicializa conexão com SQLite
         
         Args:
             base_path: Diretório para o banco de dados
             db_name: Nome do arquivo do banco
+            quiet: Suprime mensagens e barras de progresso
         """
-        super().__init__(base_path)
+        super().__init__(base_path, quiet)
         self.db_path = self.base_path / db_name
+        
+        # Conexão única, aberta no primeiro uso e reaproveitada por todas as
+        # operações; o lock serializa o acesso quando usada por várias threads
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
         self._create_tables()
     
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Abre uma conexão configurada para escrita em lote e leitura concorrente
+        
+        Returns:
+            Conexão SQLite com WAL, sincronização reduzida, cache de 64 MB,
+            mmap de 256 MB e espera de até 5 s por locks
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA mmap_size=268435456;
+            PRAGMA busy_timeout=5000;
+        """)
+        return conn
+    
+    def _conn_rw(self) -> sqlite3.Connection:
+        """
+        Retorna a conexão persistente, abrindo-a no primeiro uso
+        
+        Deve ser chamado com self._lock adquirido.
+        
+        Returns:
+            Conexão SQLite compartilhada pela instância
+        """
+        if self._conn is None:
+            self._conn = self._connect()
+        return self._conn
+    
+    def close(self):
+        """Confirma alterações pendentes e fecha a conexão persistente"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+                self._conn.close()
+                self._conn = None
+    
     def _create_tables(self):
         """Cria tabelas necessárias no banco de dados"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn_rw() as conn:
             cursor = conn.cursor()
             
             # Tabela de notícias brutas
@@ -91,6 +242,16 @@ class SQLiteStorage(DataStorage):
                 )
             ''')
             
+            # Índices para a ordenação de get_recent_news e as agregações
+            # de get_statistics
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_raw_news_created_at ON raw_news(created_at DESC)"
+            )
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_raw_news_source ON raw_news(source)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_word_frequency_word ON word_frequency(word)"
+            )
+            
             conn.commit()
             logger.info(f"Banco de dados criado/verificado em {self.db_path}")
     
@@ -104,36 +265,30 @@ class SQLiteStorage(DataStorage):
         Returns:
             Número de registros inseridos
         """
+        now = datetime.now().isoformat()
+        rows = [
+            (item.get('title'), item.get('link'), item.get('source'), item.get('collected_at', now))
+            for item in news_items
+        ]
         inserted = 0
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            with tqdm(total=len(news_items), desc="Salvando em SQLite",
+        try:
+            with tqdm(total=len(rows), desc="Salvando em SQLite",
                       bar_format='{l_bar}{bar:30}| {n_fmt}/{total_fmt}',
-                      colour='yellow') as pbar:
-                for item in news_items:
-                    try:
-                        cursor.execute('''
-                            INSERT OR IGNORE INTO raw_news (title, link, source, collected_at)
-                            VALUES (?, ?, ?, ?)
-                        ''', (
-                            item.get('title'),
-                            item.get('link'),
-                            item.get('source'),
-                            item.get('collected_at', datetime.now().isoformat())
-                        ))
-                        if cursor.rowcount > 0:
-                            inserted += 1
-                    except sqlite3.Error as e:
-                        logger.error(f"Erro ao inserir notícia: {e}")
-                        continue
-                    finally:
-                        pbar.update(1)
-                
-                conn.commit()
-        
-        console.print(f"[green]✓ Inseridas {inserted} notícias no SQLite[/green]")
+                      colour='yellow', disable=self.quiet) as pbar:
+                # Uma única transação para o lote inteiro
+                with self._lock, self._conn_rw() as conn:
+                    changes_before = conn.total_changes
+                    conn.executemany('''
+                        INSERT OR IGNORE INTO raw_news (title, link, source, collected_at)
+                        VALUES (?, ?, ?, ?)
+                    ''', rows)
+                    inserted = conn.total_changes - changes_before
+                pbar.update(len(rows))
+        except sqlite3.Error as e:
+            logger.error(f"Erro ao inserir notícias: {e}")
+        
+        self.console.print(f"[green]✓ Inseridas {inserted} notícias no SQLite[/green]")
         return inserted
     
     def save_processed_news(self, processed_items: List[Dict]):
@@ -143,16 +298,13 @@ class SQLiteStorage(DataStorage):
         Args:
             processed_items: Lista de notícias processadas
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            for item in processed_items:
-                cursor.execute('''
-                    INSERT INTO processed_news (raw_news_id, cleaned_title)
-                    VALUES (?, ?)
-                ''', (item.get('raw_id'), item.get('cleaned_title')))
-            
-            conn.commit()
+        rows = [(item.get('raw_id'), item.get('cleaned_title')) for item in processed_items]
+        
+        with self._lock, self._conn_rw() as conn:
+            conn.executemany('''
+                INSERT INTO processed_news (raw_news_id, cleaned_title)
+                VALUES (?, ?)
+            ''', rows)
     
     def save_word_frequency(self, word_freq: List[tuple]):
         """
@@ -161,19 +313,19 @@ class SQLiteStorage(DataStorage):
         Args:
             word_freq: Lista de tuplas (palavra, frequência)
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            analysis_date = datetime.now().date()
-            
-            for word, freq in word_freq:
-                cursor.execute('''
-                    INSERT INTO word_frequency (word, frequency, analysis_date)
-                    VALUES (?, ?, ?)
-                ''', (word, freq, analysis_date))
-            
-            conn.commit()
-            logger.info(f"Salvou frequência de {len(word_freq)} palavras")
+        # Data já em texto: dispensa o adaptador de date do sqlite3 a cada linha
+        analysis_date = datetime.now().date().isoformat()
+        
+        # Gerador: o executemany consome as linhas sem materializar uma lista
+        rows = ((word, freq, analysis_date) for word, freq in word_freq)
+        
+        with self._lock, self._conn_rw() as conn:
+            conn.executemany('''
+                INSERT INTO word_frequency (word, frequency, analysis_date)
+                VALUES (?, ?, ?)
+            ''', rows)
+        
+        logger.info(f"Salvou frequência de {len(word_freq)} palavras")
     
     def get_recent_news(self, limit: int = 100) -> List[Dict]:
         """
@@ -185,7 +337,7 @@ class SQLiteStorage(DataStorage):
         Returns:
             Lista de notícias
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn_rw() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT id, title, link, source, collected_at
@@ -206,14 +358,10 @@ class SQLiteStorage(DataStorage):
         Returns:
             Dicionário com estatísticas
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn_rw() as conn:
             cursor = conn.cursor()
             
-            # Total de notícias
-            cursor.execute("SELECT COUNT(*) FROM raw_news")
-            total_news = cursor.fetchone()[0]
-            
-            # Notícias por fonte
+            # Notícias por fonte (o grupo NULL inclui as notícias sem fonte)
             cursor.execute("""
                 SELECT source, COUNT(*) as count
                 FROM raw_news
@@ -221,8 +369,12 @@ class SQLiteStorage(DataStorage):
             """)
             by_source = dict(cursor.fetchall())
             
-            # Total de palavras analisadas
-            cursor.execute("SELECT COUNT(DISTINCT word) FROM word_frequency")
+            # Total de notícias, derivado dos grupos sem nova varredura
+            total_news = sum(by_source.values())
+            
+            # Total de palavras analisadas: o GROUP BY percorre o índice
+            # idx_word_frequency_word uma vez por palavra distinta
+            cursor.execute("SELECT COUNT(*) FROM (SELECT 1 FROM word_frequency GROUP BY word)")
             unique_words = cursor.fetchone()[0]
             
             return {
@@ -235,6 +387,20 @@ class SQLiteStorage(DataStorage):
 class CSVStorage(DataStorage):
     """Armazenamento usando arquivos CSV"""
     
+    def __init__(self, base_path: str = "data", quiet: bool = False):
+        """
+        Inicializa o armazenamento CSV
+        
+        Args:
+            base_path: Diretório base para os arquivos CSV
+            quiet: Suprime mensagens
+        """
+        super().__init__(base_path, quiet)
+        
+        # Estado de append por arquivo: (colunas do cabeçalho, links já gravados),
+        # lido do disco apenas no primeiro append de cada arquivo
+        self._append_state: Dict[Path, Tuple[List[str], Set[str]]] = {}
+    
     def save(self, data: List[Dict], filename: str = "news_data.csv"):
         """
         Salva dados em arquivo CSV
@@ -249,20 +415,32 @@ class CSVStorage(DataStorage):
         
         filepath = self.base_path / filename
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold blue]Salvando CSV..."),
-            console=console
-        ) as progress:
-            task = progress.add_task("Salvando", total=1)
-            
-            # Usa pandas para facilitar a escrita
-            df = pd.DataFrame(data)
-            df.to_csv(filepath, index=False, encoding='utf-8')
-            
-            progress.update(task, advance=1)
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            _write_dict_rows(f, data)
         
-        console.print(f"[green]✓ Salvou {len(data)} registros em CSV[/green]")
+        self.console.print(f"[green]✓ Salvou {len(data)} registros em CSV[/green]")
+    
+    def save_rows(self, rows: List[tuple], header: List[str], filename: str):
+        """
+        Salva linhas em forma de tupla em arquivo CSV, sem converter para dicionários
+        
+        Args:
+            rows: Lista de tuplas na ordem das colunas do cabeçalho
+            header: Nomes das colunas
+            filename: Nome do arquivo CSV
+        """
+        if not rows:
+            logger.warning("Nenhum dado para salvar em CSV")
+            return
+        
+        filepath = self.base_path / filename
+        
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+        
+        self.console.print(f"[green]✓ Salvou {len(rows)} registros em CSV[/green]")
     
     def load(self, filename: str = "news_data.csv") -> List[Dict]:
         """
@@ -272,16 +450,32 @@ class CSVStorage(DataStorage):
             filename: Nome do arquivo CSV
             
         Returns:
-            Lista de dicionários com os dados
+            Lista de dicionários com os dados; colunas numéricas e booleanas
+            são convertidas e células vazias viram None
+        """
+        # O tipo de cada coluna depende de todos os seus valores, então a
+        # conversão acontece depois da leitura completa
+        return _convert_csv_rows(list(self.iter_load(filename)))
+    
+    def iter_load(self, filename: str = "news_data.csv") -> Iterator[Dict]:
+        """
+        Lê um arquivo CSV linha a linha, sem carregá-lo inteiro na memória
+        
+        Args:
+            filename: Nome do arquivo CSV
+            
+        Yields:
+            Um dicionário por linha, com os valores como texto (use load
+            para obter colunas tipadas)
         """
         filepath = self.base_path / filename
         
         if not filepath.exists():
             logger.warning(f"Arquivo {filepath} não encontrado")
-            return []
+            return
         
-        df = pd.read_csv(filepath, encoding='utf-8')
-        return df.to_dict('records')
+        with open(filepath, 'r', newline='', encoding='utf-8') as f:
+            yield from csv.DictReader(f)
     
     def append(self, data: List[Dict], filename: str = "news_data.csv"):
         """
@@ -296,19 +490,62 @@ class CSVStorage(DataStorage):
         if not data:
             return
         
-        df_new = pd.DataFrame(data)
+        fieldnames, seen_links = self._get_append_state(filepath, data)
         
-        if filepath.exists():
-            df_existing = pd.read_csv(filepath, encoding='utf-8')
-            df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-            # Remove duplicatas baseadas no link
-            if 'link' in df_combined.columns:
-                df_combined = df_combined.drop_duplicates(subset=['link'], keep='first')
-        else:
-            df_combined = df_new
+        # Remove duplicatas baseadas no link, contra o arquivo e dentro do lote
+        new_rows = []
+        for item in data:
+            link = item.get('link')
+            if link is not None:
+                if link in seen_links:
+                    continue
+                seen_links.add(link)
+            new_rows.append(item)
+        
+        if not new_rows:
+            logger.info("Nenhum registro novo para adicionar ao CSV")
+            return
         
-        df_combined.to_csv(filepath, index=False, encoding='utf-8')
-        logger.info(f"Adicionados {len(data)} registros ao CSV")
+        # Escreve apenas as linhas novas no fim do arquivo
+        write_header = not filepath.exists() or filepath.stat().st_size == 0
+        with open(filepath, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, restval='', extrasaction='ignore')
+            if write_header:
+                writer.writeheader()
+            writer.writerows(new_rows)
+        
+        logger.info(f"Adicionados {len(new_rows)} registros ao CSV")
+    
+    def _get_append_state(self, filepath: Path, data: List[Dict]) -> Tuple[List[str], Set[str]]:
+        """
+        Retorna as colunas e os links já gravados em um arquivo CSV
+        
+        Na primeira chamada para o arquivo, lê o cabeçalho e a coluna de links
+        do disco; nas seguintes, reaproveita o estado em memória.
+        
+        Args:
+            filepath: Caminho do arquivo CSV
+            data: Lote a ser adicionado, usado para definir as colunas de um arquivo novo
+            
+        Returns:
+            Tupla (colunas do cabeçalho, conjunto de links já gravados)
+        """
+        state = self._append_state.get(filepath)
+        if state is None or not filepath.exists():
+            # Arquivo novo: colunas são a união das chaves do lote, para que
+            # chaves ausentes no primeiro registro não sejam descartadas
+            fieldnames, seen_links = _union_fieldnames(data), set()
+            
+            if filepath.exists():
+                with open(filepath, newline='', encoding='utf-8') as f:
+                    reader = csv.DictReader(f)
+                    fieldnames = reader.fieldnames or fieldnames
+                    if 'link' in fieldnames:
+                        seen_links = {row['link'] for row in reader}
+            
+            state = self._append_state[filepath] = (fieldnames, seen_links)
+        
+        return state
 
 
 class ParquetStorage(DataStorage):
@@ -328,28 +565,33 @@ class ParquetStorage(DataStorage):
         
         filepath = self.base_path / filename
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold blue]Salvando Parquet..."),
-            console=console
-        ) as progress:
-            task = progress.add_task("Salvando", total=1)
-            
-            df = pd.DataFrame(data)
-            try:
-                # Tenta usar pyarrow se disponível
-                df.to_parquet(filepath, engine='pyarrow', compression='snappy')
-            except ImportError:
-                # Fallback para fastparquet ou salva como CSV comprimido
-                csv_path = filepath.with_suffix('.csv.gz')
-                df.to_csv(csv_path, index=False, compression='gzip')
-                console.print(f"[yellow]⚠ Parquet não disponível, salvou como CSV comprimido[/yellow]")
-                progress.update(task, advance=1)
-                return
-            
-            progress.update(task, advance=1)
+        try:
+            # Tenta usar pyarrow se disponível
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            # Fallback: salva como CSV comprimido
+            csv_path = filepath.with_suffix('.csv.gz')
+            with gzip.open(csv_path, 'wt', newline='', encoding='utf-8') as f:
+                _write_dict_rows(f, data)
+            self.console.print(f"[yellow]⚠ Parquet não disponível, salvou como CSV comprimido[/yellow]")
+            return
         
-        console.print(f"[green]✓ Salvou {len(data)} registros em Parquet[/green]")
+        # Converte direto para Arrow, sem passar por um DataFrame do pandas;
+        # as colunas são a união das chaves (from_pylist usaria só as do primeiro registro)
+        fieldnames = _union_fieldnames(data)
+        table = pa.Table.from_pydict({key: [row.get(key) for row in data] for key in fieldnames})
+        parquet_config = STORAGE_CONFIG['parquet']
+        pq.write_table(
+            table,
+            filepath,
+            compression=parquet_config['compression'],
+            compression_level=parquet_config['compression_level'],
+            use_dictionary=parquet_config['use_dictionary'],
+            row_group_size=len(data)  # Um único row group com todas as linhas
+        )
+        
+        self.console.print(f"[green]✓ Salvou {len(data)} registros em Parquet[/green]")
     
     def load(self, filename: str = "news_data.parquet") -> List[Dict]:
         """
@@ -361,14 +603,29 @@ class ParquetStorage(DataStorage):
         Returns:
             Lista de dicionários com os dados
         """
+        return list(self.iter_load(filename))
+    
+    def iter_load(self, filename: str = "news_data.parquet") -> Iterator[Dict]:
+        """
+        Lê um arquivo Parquet em lotes, mantendo só um lote por vez na memória
+        
+        Args:
+            filename: Nome do arquivo Parquet
+            
+        Yields:
+            Um dicionário por registro
+        """
         filepath = self.base_path / filename
         
         if not filepath.exists():
             logger.warning(f"Arquivo {filepath} não encontrado")
-            return []
+            return
+        
+        import pyarrow.parquet as pq
         
-        df = pd.read_parquet(filepath, engine='pyarrow')
-        return df.to_dict('records')
+        # Converte direto para dicionários, sem passar por um DataFrame do pandas
+        for batch in pq.ParquetFile(filepath).iter_batches():
+            yield from batch.to_pylist()
 
 
 class JSONStorage(DataStorage):
@@ -384,22 +641,30 @@ class JSONStorage(DataStorage):
         """
         filepath = self.base_path / filename
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold blue]Salvando JSON..."),
-            console=console
-        ) as progress:
-            task = progress.add_task("Salvando", total=1)
-            
+        if _is_json_lines(filepath):
+            # JSON Lines: um registro por linha, para leitura em streaming
+            rows = data if isinstance(data, list) else [data]
+            if orjson is not None:
+                option = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                with open(filepath, 'wb') as f:
+                    f.writelines(orjson.dumps(row, option=option) for row in rows)
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    f.writelines(json.dumps(row, ensure_ascii=False) + '\n' for row in rows)
+        elif orjson is not None:
+            # orjson gera bytes UTF-8 diretamente, sem string intermediária
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            progress.update(task, advance=1)
         
-        items_count = len(data) if isinstance(data, list) else 1
-        console.print(f"[green]✓ Salvou dados em JSON[/green]")
+        self.console.print(f"[green]✓ Salvou dados em JSON[/green]")
     
-    def load(self, filename: str = "news_data.json") -> List[Dict]:
+    def load(self, filename: str = "news_data.json") -> List[Dict] | Dict:
         """
         Carrega dados de arquivo JSON
         
@@ -407,7 +672,7 @@ class JSONStorage(DataStorage):
             filename: Nome do arquivo JSON
             
         Returns:
-            Lista de dicionários com os dados
+            Lista de dicionários com os dados (ou o dicionário salvo)
         """
         filepath = self.base_path / filename
         
@@ -415,5 +680,43 @@ class JSONStorage(DataStorage):
             logger.warning(f"Arquivo {filepath} não encontrado")
             return []
         
+        if _is_json_lines(filepath):
+            return list(self.iter_load(filename))
+        
+        if orjson is not None:
+            with open(filepath, 'rb') as f:
+                return orjson.loads(f.read())
+        
         with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
\ No newline at end of file
+            return json.load(f)
+    
+    def iter_load(self, filename: str = "news_data.json") -> Iterator[Dict]:
+        """
+        Lê registros de um arquivo JSON um a um
+        
+        Arquivos JSON Lines (.jsonl/.ndjson) são lidos linha a linha, com
+        memória constante; um .json comum precisa ser lido inteiro antes
+        de os registros serem entregues.
+        
+        Args:
+            filename: Nome do arquivo JSON
+            
+        Yields:
+            Um dicionário por registro
+        """
+        filepath = self.base_path / filename
+        
+        if not filepath.exists():
+            logger.warning(f"Arquivo {filepath} não encontrado")
+            return
+        
+        if not _is_json_lines(filepath):
+            data = self.load(filename)
+            yield from (data if isinstance(data, list) else [data])
+            return
+        
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(filepath, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
\ No newline at end of file
@@ -1,37 +1,46 @@
 import re
 import string
+import sys
 from collections import Counter
+from itertools import chain
 from typing import List, Dict, Tuple
+from functools import cached_property
 import logging
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 from tqdm import tqdm
 from rich.console import Console
 
+from config import CUSTOM_STOPWORDS
+
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Padrões de limpeza compilados uma única vez no carregamento do módulo.
+# _CLEAN_RE remove, em uma só varredura: URLs, menções (@usuario), hashtags,
+# números isolados e caracteres especiais (mantendo espaços e letras)
+_CLEAN_RE = re.compile(r'https?://\S+|@\w+|#\w+|\b\d+\b|[^a-zA-Z\s]')
+_WS_RE = re.compile(r'\s+')
+# Tokens: sequências de 3 ou mais letras (o texto já chega limpo)
+_TOK_RE = re.compile(r'[a-z]{3,}')
+
 
 class TextProcessor:
     """Classe para processamento e transformação de textos"""
     
-    def __init__(self, language: str = 'english'):
+    def __init__(self, language: str = 'english', use_nltk_stopwords: bool = False,
+                 quiet: bool = False):
         """
         Inicializa o processador de texto
         
         Args:
             language: Idioma para stopwords (english ou portuguese)
+            use_nltk_stopwords: Acrescenta as stopwords do NLTK às locais;
+                o corpus só é carregado (e baixado, se preciso) no primeiro uso
+            quiet: Suprime mensagens e barras de progresso
         """
         self.language = language
-        self._download_nltk_data()
-        
-        try:
-            self.stop_words = set(stopwords.words(language))
-        except OSError:
-            # Fallback se o idioma não estiver disponível
-            console.print(f"[yellow]Stopwords para '{language}' não disponíveis, usando inglês[/yellow]")
-            self.stop_words = set(stopwords.words('english'))
+        self.use_nltk_stopwords = use_nltk_stopwords
+        self.quiet = quiet
+        self.console = Console(quiet=True) if quiet else console
         
         # Adiciona stopwords customizadas baseadas no idioma
         if language == 'portuguese':
@@ -74,22 +83,52 @@ class TextProcessor:
                 'do', 'at', 'this', 'but', 'his', 'by', 'from', 'up', 'about',
                 'into', 'through', 'during', 'after', 'above', 'below', 'between'
             }
+    
+    @cached_property
+    def stop_words(self) -> frozenset:
+        """
+        Stopwords locais e do config (e do NLTK, se habilitado) em um único
+        frozenset, para que cada token faça apenas uma busca
+        
+        Returns:
+            Conjunto imutável de stopwords do idioma
+        """
+        stop_words = frozenset(self.custom_stopwords).union(
+            CUSTOM_STOPWORDS.get(self.language, frozenset())
+        )
+        
+        if self.use_nltk_stopwords:
+            stop_words = stop_words.union(self._load_nltk_stopwords())
+        
+        return stop_words
+    
+    def _load_nltk_stopwords(self) -> List[str]:
+        """
+        Carrega as stopwords do NLTK para o idioma, importando o NLTK sob demanda
+        
+        Returns:
+            Lista de stopwords do NLTK
+        """
+        from nltk.corpus import stopwords
         
-        self.stop_words.update(self.custom_stopwords)
+        self._download_nltk_data()
+        
+        try:
+            return stopwords.words(self.language)
+        except OSError:
+            # Fallback se o idioma não estiver disponível
+            self.console.print(f"[yellow]Stopwords para '{self.language}' não disponíveis, usando inglês[/yellow]")
+            return stopwords.words('english')
     
     def _download_nltk_data(self):
-        """Baixa dados necessários do NLTK se ainda não estiverem disponíveis"""
+        """Baixa as stopwords do NLTK se ainda não estiverem disponíveis"""
+        import nltk
+        
         try:
-            nltk.data.find('tokenizers/punkt')
+            nltk.data.find('corpora/stopwords')
         except LookupError:
-            console.print("[yellow]Baixando dados do NLTK pela primeira vez...[/yellow]")
-            with tqdm(total=3, desc="Baixando pacotes NLTK", colour='yellow') as pbar:
-                nltk.download('punkt', quiet=True)
-                pbar.update(1)
-                nltk.download('stopwords', quiet=True)
-                pbar.update(1)
-                nltk.download('punkt_tab', quiet=True)
-                pbar.update(1)
+            self.console.print("[yellow]Baixando dados do NLTK pela primeira vez...[/yellow]")
+            nltk.download('stopwords', quiet=True)
     
     def clean_text(self, text: str) -> str:
         """
@@ -101,23 +140,11 @@ class TextProcessor:
         Returns:
             Texto limpo e normalizado
         """
-        # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-        
-        # Remove menções (@usuario)
-        text = re.sub(r'@\w+', '', text)
-        
-        # Remove hashtags
-        text = re.sub(r'#\w+', '', text)
-        
-        # Remove números isolados
-        text = re.sub(r'\b\d+\b', '', text)
-        
-        # Remove caracteres especiais mantendo espaços e letras
-        text = re.sub(r'[^a-zA-Z\s]', '', text)
+        # Remove URLs, menções, hashtags, números e caracteres especiais
+        text = _CLEAN_RE.sub('', text)
         
         # Remove espaços múltiplos
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         
         # Converte para minúsculas e remove espaços nas extremidades
         text = text.lower().strip()
@@ -129,14 +156,13 @@ class TextProcessor:
         Remove stopwords do texto
         
         Args:
-            text: Texto de entrada
+            text: Texto de entrada, já em minúsculas (saída de clean_text)
             
         Returns:
             Texto sem stopwords
         """
-        words = text.split()
-        filtered_words = [word for word in words if word.lower() not in self.stop_words]
-        return ' '.join(filtered_words)
+        stop_words = self.stop_words
+        return ' '.join([word for word in text.split() if word not in stop_words])
     
     def tokenize(self, text: str) -> List[str]:
         """
@@ -148,46 +174,31 @@ class TextProcessor:
         Returns:
             Lista de tokens
         """
-        try:
-            # Tenta usar o tokenizador do NLTK
-            tokens = word_tokenize(text.lower())
-        except:
-            # Fallback para split simples se NLTK falhar
-            tokens = text.lower().split()
-        
-        # Remove tokens vazios e muito curtos
-        tokens = [token for token in tokens if len(token) > 2]
-        
-        return tokens
+        # Uma única varredura já descarta pontuação e tokens muito curtos
+        return _TOK_RE.findall(text.lower())
     
-    def process_titles(self, titles: List[str]) -> List[str]:
+    def process_titles(self, titles: List[str], keep_empty: bool = False) -> List[str]:
         """
         Processa uma lista de títulos aplicando limpeza e remoção de stopwords
         
         Args:
             titles: Lista de títulos para processar
+            keep_empty: Mantém títulos que ficaram vazios, preservando o
+                alinhamento com a lista de entrada
             
         Returns:
             Lista de títulos processados
         """
-        processed = []
+        # Limpa o texto e remove stopwords de cada título (métodos ligados
+        # uma vez fora do laço; subclasses que os sobrescrevem são respeitadas)
+        clean_text, remove_stopwords = self.clean_text, self.remove_stopwords
+        processed = [remove_stopwords(clean_text(title)) for title in titles]
         
-        with tqdm(total=len(titles), desc="Processando títulos",
-                  bar_format='{l_bar}{bar:30}| {n_fmt}/{total_fmt} [{elapsed}]',
-                  colour='blue') as pbar:
-            for title in titles:
-                # Limpa o texto
-                cleaned = self.clean_text(title)
-                
-                # Remove stopwords
-                without_stopwords = self.remove_stopwords(cleaned)
-                
-                if without_stopwords:  # Adiciona apenas se não estiver vazio
-                    processed.append(without_stopwords)
-                
-                pbar.update(1)
+        if keep_empty:
+            return processed
         
-        return processed
+        # Descarta vazios por padrão
+        return [title for title in processed if title]
     
     def get_word_frequency(self, texts: List[str], top_n: int = 20) -> List[Tuple[str, int]]:
         """
@@ -200,22 +211,17 @@ class TextProcessor:
         Returns:
             Lista de tuplas (palavra, frequência) ordenada por frequência
         """
-        all_words = []
-        
-        with tqdm(total=len(texts), desc="Analisando frequência",
+        # Redesenha a barra no máximo a cada 0,5 s, não a cada texto
+        with tqdm(texts, desc="Analisando frequência",
                   bar_format='{l_bar}{bar:30}| {n_fmt}/{total_fmt}',
-                  colour='magenta') as pbar:
-            for text in texts:
-                # Tokeniza e adiciona palavras à lista
-                tokens = self.tokenize(text)
-                all_words.extend(tokens)
-                pbar.update(1)
+                  colour='magenta', mininterval=0.5,
+                  disable=self.quiet or not sys.stderr.isatty()) as progress_texts:
+            # Conta os tokens direto do iterador, sem montar uma lista intermediária
+            word_freq = Counter(chain.from_iterable(map(self.tokenize, progress_texts)))
         
-        # Conta frequência das palavras com progresso
-        console.print("[cyan]Calculando palavras mais frequentes...[/cyan]")
-        word_freq = Counter(all_words)
+        self.console.print("[cyan]Calculando palavras mais frequentes...[/cyan]")
         
-        # Retorna as N palavras mais comuns
+        # Retorna as N palavras mais comuns (seleção parcial via heap)
         return word_freq.most_common(top_n)
     
     def get_statistics(self, texts: List[str]) -> Dict:
@@ -228,18 +234,17 @@ class TextProcessor:
         Returns:
             Dicionário com estatísticas
         """
-        all_words = []
-        for text in texts:
-            all_words.extend(self.tokenize(text))
-        
-        unique_words = set(all_words)
+        # Conta os tokens sem montar a lista com todas as palavras
+        word_counts = Counter(chain.from_iterable(map(self.tokenize, texts)))
+        total_words = sum(word_counts.values())
+        unique_words = len(word_counts)
         
         stats = {
             'total_texts': len(texts),
-            'total_words': len(all_words),
-            'unique_words': len(unique_words),
-            'avg_words_per_text': len(all_words) / len(texts) if texts else 0,
-            'vocabulary_richness': len(unique_words) / len(all_words) if all_words else 0
+            'total_words': total_words,
+            'unique_words': unique_words,
+            'avg_words_per_text': total_words / len(texts) if texts else 0,
+            'vocabulary_richness': unique_words / total_words if total_words else 0
         }
         
         return stats
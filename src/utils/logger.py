@@ -1,9 +1,28 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 
 
+class _LogListener(QueueListener):
+    """QueueListener cujo stop() pode ser chamado mais de uma vez"""
+    
+    _running = False
+    
+    def start(self):
+        super().start()
+        self._running = True
+    
+    def stop(self):
+        # Quem chamou pode já ter encerrado o listener antes do gancho de saída
+        if self._running:
+            self._running = False
+            super().stop()
+
+
 def setup_logger(name: str = "news_scraper", log_dir: str = "logs") -> logging.Logger:
     """
     Configura e retorna um logger personalizado
@@ -26,7 +45,16 @@ def setup_logger(name: str = "news_scraper", log_dir: str = "logs") -> logging.L
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)
     
-    # Remove handlers existentes para evitar duplicação
+    # Encerra o listener de uma configuração anterior e remove handlers
+    # existentes para evitar duplicação
+    previous = getattr(logger, '_qlistener', None)
+    if previous is not None:
+        previous.stop()
+        atexit.unregister(previous.stop)
+        for handler in previous.handlers:
+            handler.close()
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
     
     # Formato das mensagens
@@ -39,12 +67,25 @@ def setup_logger(name: str = "news_scraper", log_dir: str = "logs") -> logging.L
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
     
     # Handler para console
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
+    
+    # O console é escrito na thread de quem loga, para não se intercalar com a
+    # saída ao vivo do Rich; só a escrita em arquivo vai para a thread de fundo
     logger.addHandler(console_handler)
     
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    
+    listener = _LogListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    
+    # Exposto para que quem chamou possa encerrar (e esvaziar a fila) antes de
+    # sair; a parada registrada no atexit ignora um listener já encerrado
+    logger._qlistener = listener
+    atexit.register(listener.stop)
+    
     return logger
\ No newline at end of file
@@ -1,63 +1,233 @@
 """
 Módulo de progresso e indicadores visuais
+
+Rich, tqdm e colorama são importados apenas no primeiro uso, para que
+importar este módulo não custe a carga dessas bibliotecas.
 """
 
-from tqdm import tqdm
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
-from rich.table import Table
-from rich.panel import Panel
-from rich.layout import Layout
-from rich.live import Live
-from rich import print as rprint
+import os
+import sys
+import threading
 import time
-from typing import Optional, List, Dict
-from colorama import init, Fore, Style
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Iterable, Optional, List, Dict
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress
+    from rich.table import Table
+    from rich.text import Text
+    from tqdm import tqdm
+
+# Saída interativa? Fora de um terminal (CI, SLURM, `| tee`) barras, spinners
+# e marcação Rich são trocados por saída simples, sem sequências de controle.
+# No Windows a variável TERM normalmente não existe, então só é exigida fora dele
+_TERM = os.environ.get('TERM')
+IS_TTY = sys.stderr.isatty() and _TERM != 'dumb' and (_TERM is not None or sys.platform == 'win32')
+# IS_TTY vale para as barras do tqdm, que escrevem no stderr; mensagens, passos
+# e spinners saem pelo console Rich (stdout) e usam _is_interactive(console)
+
+
+def _is_interactive(console: "Console") -> bool:
+    """Indica se o console escreve em um terminal capaz de exibir marcação"""
+    return console.is_terminal and not console.is_dumb_terminal
+
+
+_console = None
+_ansi_ready = False
+
+
+def _get_console() -> "Console":
+    """
+    Retorna o Console compartilhado do módulo, criando-o no primeiro uso
+    
+    Returns:
+        Objeto Console do Rich
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+def _ensure_ansi():
+    """
+    Habilita sequências ANSI no console do Windows, uma única vez por processo
+    
+    Em outros sistemas o terminal já as interpreta e nada é feito; no Windows
+    just_fix_windows_console apenas liga o modo VT, sem envolver stdout/stderr.
+    """
+    global _ansi_ready
+    if _ansi_ready:
+        return
+    _ansi_ready = True
+    
+    if sys.platform == 'win32' and sys.stdout.isatty():
+        from colorama import just_fix_windows_console
+        just_fix_windows_console()
 
-# Inicializa colorama para cores no terminal Windows
-init(autoreset=True)
 
-console = Console()
+def __getattr__(name: str):
+    # Mantém `progress.console` disponível sem criá-lo na importação (PEP 562)
+    if name == 'console':
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Ícone e marcações de cor por tipo de status, montados uma vez no import
+_STATUS_STYLES = {
+    status: (icon, f"[{color}]", f"[/{color}]")
+    for status, icon, color in (
+        ("info", "ℹ️", "blue"),
+        ("success", "✅", "green"),
+        ("warning", "⚠️", "yellow"),
+        ("error", "❌", "red"),
+    )
+}
+_DEFAULT_STATUS_STYLE = ("", "[white]", "[/white]")
+
+# Barras de passo pré-calculadas para cada quantidade de blocos preenchidos
+_STEP_BAR_LENGTH = 20
+BAR_CACHE = [
+    '█' * filled + '░' * (_STEP_BAR_LENGTH - filled)
+    for filled in range(_STEP_BAR_LENGTH + 1)
+]
+_BAR_BYTES = [bar.encode('utf-8') for bar in BAR_CACHE]
+
+# Cores das barras tqdm embutidas no bar_format, sem o processamento de `colour`
+_COLOR_ANSI = {
+    'black': '\033[30m',
+    'red': '\033[31m',
+    'green': '\033[32m',
+    'yellow': '\033[33m',
+    'blue': '\033[34m',
+    'magenta': '\033[35m',
+    'cyan': '\033[36m',
+    'white': '\033[37m',
+}
+_RESET = '\033[0m'
+_SIMPLE_BAR_FORMAT = f"{{l_bar}}{_COLOR_ANSI['green']}{{bar}}{_RESET}{{r_bar}}"
+
+
+@lru_cache(maxsize=256)
+def _render_step(step_number: int, total_steps: int, description: str, plain: bool = False) -> str:
+    """
+    Monta (e memoriza) a linha formatada de um passo do processo
+    
+    Args:
+        step_number: Número do passo atual
+        total_steps: Total de passos
+        description: Descrição do passo
+        plain: Gera texto simples, sem marcação Rich
+    
+    Returns:
+        Texto pronto para impressão
+    """
+    percentage = (step_number / total_steps) * 100
+    filled = min(max(int(_STEP_BAR_LENGTH * step_number / total_steps), 0), _STEP_BAR_LENGTH)
+    
+    if plain:
+        return (
+            f"\nPasso {step_number}/{total_steps} "
+            f"{BAR_CACHE[filled]} {percentage:.0f}% - {description}"
+        )
+    
+    return (
+        f"\n[bold cyan]Passo {step_number}/{total_steps}[/bold cyan] "
+        f"[green]{BAR_CACHE[filled]}[/green] {percentage:.0f}% - {description}"
+    )
 
 
 class ProgressIndicator:
     """Classe para gerenciar indicadores de progresso"""
     
     def __init__(self):
-        self.console = Console()
         self.current_task = None
         self.progress = None
     
+    @cached_property
+    def console(self) -> "Console":
+        """Console usado nas saídas (criado no primeiro acesso)"""
+        return _get_console()
+    
     def create_progress_bar(self, total: int, description: str = "Processando", 
-                           color: str = "cyan", leave: bool = True) -> tqdm:
+                           color: str = "cyan", leave: bool = True,
+                           refresh_hz: float = 15) -> "tqdm":
         """
         Cria uma barra de progresso simples usando tqdm
         
         Args:
             total: Total de itens a processar
             description: Descrição da tarefa
-            color: Cor da barra
+            color: Cor da barra (nome ANSI básico, ex.: cyan, green)
             leave: Se deve manter a barra após conclusão
+            refresh_hz: Máximo de redesenhos por segundo, independente
+                da velocidade das iterações
         
         Returns:
             Objeto tqdm para atualização
         """
+        from tqdm import tqdm
+        
+        _ensure_ansi()
+        
+        color_code = _COLOR_ANSI.get(color, '')
+        reset = _RESET if color_code else ''
+        
         return tqdm(
             total=total,
             desc=description,
-            bar_format=f'{{l_bar}}{{bar:30}}| {{n_fmt}}/{{total_fmt}} [{{elapsed}}<{{remaining}}]',
-            colour=color,
+            bar_format=f'{{l_bar}}{color_code}{{bar:30}}{reset}| {{n_fmt}}/{{total_fmt}} [{{elapsed}}<{{remaining}}]',
             leave=leave,
-            ncols=100
+            ncols=100,
+            mininterval=1.0 / refresh_hz,
+            miniters=None,
+            smoothing=0.1,
+            disable=not IS_TTY
         )
     
-    def create_rich_progress(self) -> Progress:
+    def fast_track(self, iterable: Iterable, total: Optional[int] = None,
+                   description: str = "Processando") -> "tqdm":
+        """
+        Envolve um iterável com uma barra tqdm de baixo custo por iteração,
+        indicada para laços internos (por artigo, por palavra)
+        
+        Args:
+            iterable: Itens a percorrer
+            total: Total de itens (inferido de len() quando omitido)
+            description: Descrição da tarefa
+        
+        Returns:
+            Iterador tqdm sobre os itens
+        """
+        from tqdm import tqdm
+        
+        # miniters=None mantém o ajuste automático do tqdm: o relógio só é
+        # consultado a cada N iterações, e a tela é redesenhada no máximo a cada 0,1 s
+        return tqdm(iterable, total=total, desc=description, ncols=100,
+                    mininterval=0.1, miniters=None, smoothing=0.3, disable=not IS_TTY)
+    
+    def create_rich_progress(self, refresh_per_second: float = 4) -> "Progress":
         """
         Cria um indicador de progresso rico com múltiplas colunas
         
+        Reservado para as etapas externas do pipeline: o custo por iteração
+        do Rich é cerca de 10x o do tqdm, então laços com mais de ~10 mil
+        itens devem usar fast_track ou simple_progress.
+        
+        Args:
+            refresh_per_second: Frequência de redesenho da thread do Rich
+                (padrão do Rich: 10); etapas que levam segundos não precisam de mais
+        
         Returns:
             Objeto Progress do Rich
         """
+        from rich.progress import (
+            Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
+        )
+        
         return Progress(
             SpinnerColumn(),
             TextColumn("[bold blue]{task.description}"),
@@ -65,6 +235,7 @@ class ProgressIndicator:
             TaskProgressColumn(),
             TimeRemainingColumn(),
             console=self.console,
+            refresh_per_second=refresh_per_second,
             expand=False
         )
     
@@ -76,26 +247,16 @@ class ProgressIndicator:
             message: Mensagem a exibir
             status: Tipo de status (info, success, warning, error)
         """
-        colors = {
-            "info": "blue",
-            "success": "green",
-            "warning": "yellow",
-            "error": "red"
-        }
-        
-        icons = {
-            "info": "ℹ️",
-            "success": "✅",
-            "warning": "⚠️",
-            "error": "❌"
-        }
+        icon, open_tag, close_tag = _STATUS_STYLES.get(status, _DEFAULT_STATUS_STYLE)
         
-        color = colors.get(status, "white")
-        icon = icons.get(status, "")
+        # Texto simples, mas pelo console: um console silencioso (--quiet) também o descarta
+        if not _is_interactive(self.console):
+            self.console.print(f"{icon} {message}", markup=False, highlight=False)
+            return
         
-        self.console.print(f"{icon} [{color}]{message}[/{color}]")
+        self.console.print(f"{icon} {open_tag}{message}{close_tag}")
     
-    def show_spinner(self, message: str, task_function, *args, **kwargs):
+    def show_spinner(self, message: str, task_function, *args, no_spinner: bool = False, **kwargs):
         """
         Mostra um spinner enquanto executa uma tarefa
         
@@ -103,15 +264,20 @@ class ProgressIndicator:
             message: Mensagem a exibir
             task_function: Função a executar
             *args, **kwargs: Argumentos para a função
+            no_spinner: Executa sem spinner; para tarefas curtas, evita subir
+                a thread de atualização do Rich só para descartá-la em seguida
         
         Returns:
             Resultado da função executada
         """
-        with self.console.status(f"[bold green]{message}...", spinner="dots") as status:
-            result = task_function(*args, **kwargs)
-            return result
+        # Sem terminal o spinner não seria visto: executa direto
+        if no_spinner or not _is_interactive(self.console):
+            return task_function(*args, **kwargs)
+        
+        with self.console.status(f"[bold green]{message}...", spinner="dots"):
+            return task_function(*args, **kwargs)
     
-    def create_table(self, title: str, headers: List[str], rows: List[List]) -> Table:
+    def create_table(self, title: str, headers: List[str], rows: List[List]) -> "Table":
         """
         Cria uma tabela formatada
         
@@ -123,13 +289,16 @@ class ProgressIndicator:
         Returns:
             Objeto Table do Rich
         """
+        from rich.table import Table
+        
         table = Table(title=title, show_header=True, header_style="bold magenta")
         
         for header in headers:
             table.add_column(header, style="cyan")
         
+        add_row = table.add_row
         for row in rows:
-            table.add_row(*[str(item) for item in row])
+            add_row(*map(str, row))
         
         return table
     
@@ -142,6 +311,8 @@ class ProgressIndicator:
             title: Título do painel
             border_style: Estilo da borda
         """
+        from rich.panel import Panel
+        
         panel = Panel(content, title=title, border_style=border_style, expand=False)
         self.console.print(panel)
     
@@ -154,15 +325,12 @@ class ProgressIndicator:
             total_steps: Total de passos
             description: Descrição do passo
         """
-        percentage = (step_number / total_steps) * 100
-        bar_length = 20
-        filled = int(bar_length * step_number / total_steps)
-        bar = '█' * filled + '░' * (bar_length - filled)
+        if not _is_interactive(self.console):
+            self.console.print(_render_step(step_number, total_steps, description, plain=True),
+                               markup=False, highlight=False)
+            return
         
-        self.console.print(
-            f"\n[bold cyan]Passo {step_number}/{total_steps}[/bold cyan] "
-            f"[green]{bar}[/green] {percentage:.0f}% - {description}"
-        )
+        self.console.print(_render_step(step_number, total_steps, description))
     
     def animate_text(self, text: str, delay: float = 0.03):
         """
@@ -172,18 +340,64 @@ class ProgressIndicator:
             text: Texto a animar
             delay: Delay entre caracteres
         """
+        # Sem atraso ou fora de um terminal a animação não tem efeito visível:
+        # escreve tudo de uma vez
+        if delay <= 0 or not sys.stdout.isatty():
+            sys.stdout.write(text + '\n')
+            sys.stdout.flush()
+            return
+        
+        write, flush = sys.stdout.write, sys.stdout.flush
         for char in text:
-            print(char, end='', flush=True)
+            write(char)
+            flush()
             time.sleep(delay)
-        print()
+        write('\n')
+
+
+@dataclass(slots=True)
+class TaskState:
+    """Estado de uma tarefa rastreada pelo TaskTracker"""
+    
+    description: str
+    total: int
+    completed: int = 0
+    status: str = 'pending'
+    start_time: float = field(default_factory=time.time)
+    end_time: Optional[float] = None
+    error: Optional[str] = None
 
 
 class TaskTracker:
     """Rastreador de tarefas com progresso detalhado"""
     
     def __init__(self):
-        self.tasks = {}
-        self.console = Console()
+        self.tasks: Dict[str, TaskState] = {}
+        # Quantidade de tarefas por status, ajustada a cada transição para
+        # que o resumo não precise percorrer todas as tarefas
+        self._counts = {'completed': 0, 'in_progress': 0, 'failed': 0, 'pending': 0}
+        # Última tabela de resumo montada e as contagens que a geraram
+        self._summary_table = None
+        self._summary_key = None
+        # Serializa as atualizações vindas de várias threads de scraping
+        self._lock = threading.Lock()
+    
+    @cached_property
+    def console(self) -> "Console":
+        """Console usado nas saídas (criado no primeiro acesso)"""
+        return _get_console()
+    
+    def _set_status(self, task: TaskState, status: str):
+        """
+        Muda o status de uma tarefa mantendo as contagens em dia
+        
+        Args:
+            task: Tarefa a atualizar
+            status: Novo status
+        """
+        self._counts[task.status] -= 1
+        self._counts[status] += 1
+        task.status = status
         
     def add_task(self, task_id: str, description: str, total: int):
         """
@@ -194,13 +408,13 @@ class TaskTracker:
             description: Descrição da tarefa
             total: Total de itens na tarefa
         """
-        self.tasks[task_id] = {
-            'description': description,
-            'total': total,
-            'completed': 0,
-            'status': 'pending',
-            'start_time': time.time()
-        }
+        with self._lock:
+            previous = self.tasks.get(task_id)
+            if previous is not None:
+                self._counts[previous.status] -= 1
+            
+            self.tasks[task_id] = TaskState(description, total)
+            self._counts['pending'] += 1
     
     def update_task(self, task_id: str, increment: int = 1):
         """
@@ -210,12 +424,42 @@ class TaskTracker:
             task_id: ID da tarefa
             increment: Quantidade a incrementar
         """
-        if task_id in self.tasks:
-            self.tasks[task_id]['completed'] += increment
-            if self.tasks[task_id]['completed'] >= self.tasks[task_id]['total']:
-                self.tasks[task_id]['status'] = 'completed'
-            else:
-                self.tasks[task_id]['status'] = 'in_progress'
+        task = self.tasks.get(task_id)
+        if task is None:
+            return
+        
+        with self._lock:
+            task.completed += increment
+            
+            # Só há transição na primeira atualização ou ao atingir o total;
+            # tarefas completas ou falhadas mantêm o status
+            status = task.status
+            if status == 'pending' or (status == 'in_progress' and task.completed >= task.total):
+                self._set_status(task, 'completed' if task.completed >= task.total else 'in_progress')
+    
+    def update_task_batch(self, task_id: str, n: int):
+        """
+        Registra de uma vez o progresso de vários itens de uma tarefa
+        
+        Args:
+            task_id: ID da tarefa
+            n: Quantidade de itens concluídos desde a última atualização
+        """
+        self.update_task(task_id, n)
+    
+    def batch_updater(self, task_id: str, flush_every: int = 100) -> "BatchedTaskUpdater":
+        """
+        Cria um acumulador local de progresso para uma tarefa, que só
+        repassa ao rastreador (e toma o lock) a cada `flush_every` itens
+        
+        Args:
+            task_id: ID da tarefa
+            flush_every: Quantidade de itens acumulados por repasse
+        
+        Returns:
+            Acumulador para usar em um único worker, de preferência com `with`
+        """
+        return BatchedTaskUpdater(self, task_id, flush_every)
     
     def complete_task(self, task_id: str):
         """
@@ -224,10 +468,12 @@ class TaskTracker:
         Args:
             task_id: ID da tarefa
         """
-        if task_id in self.tasks:
-            self.tasks[task_id]['status'] = 'completed'
-            self.tasks[task_id]['completed'] = self.tasks[task_id]['total']
-            self.tasks[task_id]['end_time'] = time.time()
+        task = self.tasks.get(task_id)
+        if task is not None:
+            with self._lock:
+                self._set_status(task, 'completed')
+                task.completed = task.total
+                task.end_time = time.time()
     
     def fail_task(self, task_id: str, error: str = None):
         """
@@ -237,10 +483,12 @@ class TaskTracker:
             task_id: ID da tarefa
             error: Mensagem de erro opcional
         """
-        if task_id in self.tasks:
-            self.tasks[task_id]['status'] = 'failed'
-            self.tasks[task_id]['error'] = error
-            self.tasks[task_id]['end_time'] = time.time()
+        task = self.tasks.get(task_id)
+        if task is not None:
+            with self._lock:
+                self._set_status(task, 'failed')
+                task.error = error
+                task.end_time = time.time()
     
     def get_summary(self) -> Dict:
         """
@@ -249,39 +497,100 @@ class TaskTracker:
         Returns:
             Dicionário com resumo das tarefas
         """
-        summary = {
-            'total': len(self.tasks),
-            'completed': sum(1 for t in self.tasks.values() if t['status'] == 'completed'),
-            'in_progress': sum(1 for t in self.tasks.values() if t['status'] == 'in_progress'),
-            'failed': sum(1 for t in self.tasks.values() if t['status'] == 'failed'),
-            'pending': sum(1 for t in self.tasks.values() if t['status'] == 'pending')
-        }
-        return summary
+        with self._lock:
+            return {'total': len(self.tasks), **self._counts}
     
     def display_summary(self):
         """Exibe um resumo visual das tarefas"""
+        # A tabela só é remontada quando alguma contagem mudou
+        with self._lock:
+            key = (len(self.tasks), *self._counts.values())
+        if key != self._summary_key:
+            self._summary_table = self._build_summary_table()
+            self._summary_key = key
+        
+        self.console.print(self._summary_table)
+    
+    def _build_summary_table(self) -> "Table":
+        """
+        Monta a tabela de resumo a partir das contagens atuais
+        
+        Returns:
+            Objeto Table do Rich
+        """
+        from rich.table import Table
+        
         summary = self.get_summary()
+        total = summary['total']
+        
+        rows = [
+            (label, str(count), f"{(count / total * 100) if total > 0 else 0:.1f}%")
+            for label, count in (
+                ("✅ Completas", summary['completed']),
+                ("🔄 Em Progresso", summary['in_progress']),
+                ("❌ Falhadas", summary['failed']),
+                ("⏳ Pendentes", summary['pending'])
+            )
+        ]
         
         table = Table(title="📊 Resumo de Tarefas", show_header=True, header_style="bold magenta")
         table.add_column("Status", style="cyan", width=15)
         table.add_column("Quantidade", justify="right", style="green")
         table.add_column("Porcentagem", justify="right", style="yellow")
         
-        for status, count in [
-            ("✅ Completas", summary['completed']),
-            ("🔄 Em Progresso", summary['in_progress']),
-            ("❌ Falhadas", summary['failed']),
-            ("⏳ Pendentes", summary['pending'])
-        ]:
-            percentage = (count / summary['total'] * 100) if summary['total'] > 0 else 0
-            table.add_row(status, str(count), f"{percentage:.1f}%")
+        for row in rows:
+            table.add_row(*row)
         
         table.add_row("", "", "", style="dim")
-        table.add_row("Total", str(summary['total']), "100%", style="bold")
+        table.add_row("Total", str(total), "100%", style="bold")
         
-        self.console.print(table)
+        return table
+
+
+class BatchedTaskUpdater:
+    """Acumula o progresso de uma tarefa localmente e o repassa em lotes"""
+    
+    __slots__ = ('_tracker', '_task_id', '_flush_every', '_pending')
+    
+    def __init__(self, tracker: TaskTracker, task_id: str, flush_every: int = 100):
+        """
+        Inicializa o acumulador
+        
+        Args:
+            tracker: Rastreador que recebe os lotes
+            task_id: ID da tarefa
+            flush_every: Quantidade de itens acumulados por repasse
+        """
+        self._tracker = tracker
+        self._task_id = task_id
+        self._flush_every = flush_every
+        self._pending = 0
+    
+    def update(self, n: int = 1):
+        """
+        Registra itens concluídos, repassando ao atingir o tamanho do lote
+        
+        Args:
+            n: Quantidade de itens concluídos
+        """
+        self._pending += n
+        if self._pending >= self._flush_every:
+            self.flush()
+    
+    def flush(self):
+        """Repassa ao rastreador o progresso ainda acumulado"""
+        if self._pending:
+            self._tracker.update_task_batch(self._task_id, self._pending)
+            self._pending = 0
+    
+    def __enter__(self) -> "BatchedTaskUpdater":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
 
 
+@lru_cache(maxsize=64)
 def create_ascii_banner(text: str) -> str:
     """
     Cria um banner ASCII simples
@@ -300,19 +609,41 @@ def create_ascii_banner(text: str) -> str:
 """
 
 
-def show_welcome_message():
-    """Mostra mensagem de boas-vindas com formatação"""
-    console = Console()
-    
-    welcome_text = """
+_WELCOME_TEXT = """
 ╔════════════════════════════════════════════════╗
 ║     🌐 Sistema de Scraping de Notícias 🌐      ║
 ║                                                ║
 ║         Coleta • Processa • Analisa           ║
 ╚════════════════════════════════════════════════╝
 """
-    
-    console.print(welcome_text, style="bold blue")
+
+_COMPLETION_HEADER = "\n[bold green]✨ Pipeline Concluído com Sucesso![/bold green]\n\n"
+# (rótulo, chave em stats, valor padrão) de cada linha do painel de conclusão
+_COMPLETION_LINES = (
+    ("📰 Notícias Coletadas: ", 'news_count', 0),
+    ("📝 Palavras Processadas: ", 'words_processed', 0),
+    ("💾 Arquivos Salvos: ", 'files_saved', 0),
+    ("⏱️ Tempo Total: ", 'execution_time', '0s'),
+)
+
+
+@lru_cache(maxsize=None)
+def _welcome_renderable() -> "Text":
+    """Texto de boas-vindas do Rich, montado uma única vez"""
+    from rich.text import Text
+    return Text(_WELCOME_TEXT, style="bold blue")
+
+
+@lru_cache(maxsize=None)
+def _completion_header() -> "Text":
+    """Cabeçalho do painel de conclusão, com a marcação já interpretada"""
+    from rich.text import Text
+    return Text.from_markup(_COMPLETION_HEADER)
+
+
+def show_welcome_message():
+    """Mostra mensagem de boas-vindas com formatação"""
+    _get_console().print(_welcome_renderable())
 
 
 def show_completion_message(stats: Dict):
@@ -322,34 +653,81 @@ def show_completion_message(stats: Dict):
     Args:
         stats: Dicionário com estatísticas da execução
     """
-    console = Console()
+    from rich.panel import Panel
     
-    panel_content = f"""
-[bold green]✨ Pipeline Concluído com Sucesso![/bold green]
-
-📰 Notícias Coletadas: [cyan]{stats.get('news_count', 0)}[/cyan]
-📝 Palavras Processadas: [cyan]{stats.get('words_processed', 0)}[/cyan]
-💾 Arquivos Salvos: [cyan]{stats.get('files_saved', 0)}[/cyan]
-⏱️ Tempo Total: [cyan]{stats.get('execution_time', '0s')}[/cyan]
-"""
+    # Só os valores variam: são anexados ao cabeçalho pronto, sem reinterpretar marcação
+    panel_content = _completion_header().copy()
+    for label, key, default in _COMPLETION_LINES:
+        panel_content.append(label)
+        panel_content.append(str(stats.get(key, default)), style="cyan")
+        panel_content.append("\n")
     
-    console.print(Panel(panel_content, title="📊 Resultados", border_style="green"))
+    _get_console().print(Panel(panel_content, title="📊 Resultados", border_style="green"))
 
 
 # Funções auxiliares para uso rápido
-def simple_progress(items, description="Processando"):
+def simple_progress(items, description="Processando", refresh_hz: float = 15):
     """
     Wrapper simples para tqdm com formatação padrão
     
     Args:
         items: Itens a processar
         description: Descrição da tarefa
+        refresh_hz: Máximo de redesenhos por segundo
+    
+    Yields:
+        Item processado
+    """
+    # Fora de um terminal apenas repassa os itens, sem custo por iteração
+    if not IS_TTY:
+        yield from items
+        return
+    
+    from tqdm import tqdm
+    
+    _ensure_ansi()
+    
+    # A taxa de redesenho fica limitada a refresh_hz; maxinterval garante
+    # ao menos uma atualização por segundo em laços lentos
+    for item in tqdm(items, desc=description, bar_format=_SIMPLE_BAR_FORMAT, ncols=100,
+                     mininterval=1.0 / refresh_hz, maxinterval=1.0,
+                     miniters=None, smoothing=0.1):
+        yield item
+
+
+def minimal_progress(items, total: int, description: str = '', every: int = 1024):
+    """
+    Progresso mínimo para laços muito rápidos: redesenha a cada `every`
+    itens escrevendo bytes direto no descritor do stderr, sem tqdm nem Rich
+    
+    Args:
+        items: Itens a processar
+        total: Total de itens esperado
+        description: Descrição da tarefa
+        every: Intervalo (em itens) entre redesenhos
     
     Yields:
         Item processado
     """
-    for item in tqdm(items, desc=description, colour='green', ncols=100):
+    if not IS_TTY or total <= 0:
+        yield from items
+        return
+    
+    prefix = f"\r{description}: ".encode('utf-8') if description else b"\r"
+    suffix = f"/{total}".encode('ascii')
+    
+    # Descarrega o que estiver no buffer do stderr antes das escritas diretas
+    sys.stderr.flush()
+    
+    count = 0
+    for item in items:
         yield item
+        count += 1
+        if count % every == 0 or count == total:
+            filled = min(count * _STEP_BAR_LENGTH // total, _STEP_BAR_LENGTH)
+            os.write(2, b"%s%s %d%s" % (prefix, _BAR_BYTES[filled], count, suffix))
+    
+    os.write(2, b"\n")
 
 
 def print_colored(text: str, color: str = "white"):
@@ -360,6 +738,10 @@ def print_colored(text: str, color: str = "white"):
         text: Texto a imprimir
         color: Cor do texto
     """
+    from colorama import Fore, Style
+    
+    _ensure_ansi()
+    
     colors = {
         "red": Fore.RED,
         "green": Fore.GREEN,